@@ -1,8 +1,8 @@
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 import time
-from collections import defaultdict, deque
+from collections import Counter, defaultdict
 
 @dataclass
 class BayesianPrior:
@@ -19,13 +19,104 @@ class BayesianEvidence:
     source: str
     reliability: float
 
+EVIDENCE_HALF_LIFE = 24 * 3600
+# Outcomes averaged into the recent-performance term of a prior update
+RECENT_WINDOW = 100
+# Evidence rows processed per vectorized pass when summing log-likelihoods
+EVIDENCE_TILE = 4096
+# Rows retained per hypothesis; a full store folds its oldest quarter away.
+EVIDENCE_CAPACITY = 10_000
+# Evidence newer than the frozen cutoff is re-decayed on every query; once this many
+# rows are pending they are folded into the frozen log-likelihood sums.
+ACTIVE_EVIDENCE_WINDOW = 256
+# Frozen sums keep the decay evaluated when they were folded; rebuild them after this long.
+FROZEN_MAX_AGE = 3600.0
+
+class EvidenceStore:
+    """Capped struct-of-arrays evidence log for one hypothesis.
+
+    Rows grow by doubling up to ``capacity``; past that the engine folds the
+    oldest rows into ``folded_logL``/``folded_log_notL`` and drops them.
+    """
+
+    _COLUMNS = ("evidence_id", "likelihood", "timestamp", "source", "reliability")
+
+    def __init__(self, capacity: Optional[int] = None, initial: int = 64):
+        self.capacity = capacity or EVIDENCE_CAPACITY
+        initial = min(initial, self.capacity)
+        self.likelihood = np.empty(initial, dtype=np.float64)
+        self.timestamp = np.empty(initial, dtype=np.float64)
+        self.reliability = np.empty(initial, dtype=np.float64)
+        self.source = np.empty(initial, dtype=object)
+        self.evidence_id = np.empty(initial, dtype=object)
+        self.size = 0
+        # Log-likelihood contribution of rows that were dropped from the store
+        self.folded_logL = 0.0
+        self.folded_log_notL = 0.0
+        self.folded_count = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield BayesianEvidence(
+                evidence_id=self.evidence_id[i],
+                likelihood=float(self.likelihood[i]),
+                timestamp=float(self.timestamp[i]),
+                source=self.source[i],
+                reliability=float(self.reliability[i]),
+            )
+
+    @property
+    def full(self) -> bool:
+        return self.size >= self.capacity
+
+    def append(self, evidence_id: str, likelihood: float, timestamp: float,
+               source: str, reliability: float):
+        """Append one evidence row, doubling the backing arrays when full"""
+        if self.size == len(self.likelihood):
+            self._grow(min(2 * len(self.likelihood), self.capacity))
+        i = self.size
+        self.evidence_id[i] = evidence_id
+        self.likelihood[i] = likelihood
+        self.timestamp[i] = timestamp
+        self.source[i] = source
+        self.reliability[i] = reliability
+        self.size += 1
+
+    def drop_oldest(self, count: int, logL: float, log_notL: float):
+        """Remove the first ``count`` rows, keeping their folded log-likelihood sums"""
+        self.folded_logL += logL
+        self.folded_log_notL += log_notL
+        self.folded_count += count
+        keep = self.size - count
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            column[:keep] = column[count:self.size]
+            if column.dtype == object:
+                column[keep:self.size] = None
+        self.size = keep
+
+    def _grow(self, capacity: int):
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+
 class BayesianEngine:
     def __init__(self, alpha: float = 1.0, beta: float = 1.0):
         self.priors = {}
-        self.evidence_history = defaultdict(list)
+        self.evidence_history: Dict[str, EvidenceStore] = defaultdict(EvidenceStore)
         self.alpha = alpha  # Prior success
         self.beta = beta    # Prior failure
         self.hypothesis_tracking = {}
+        # Memoized posteriors; a hypothesis is recomputed only after one of its inputs changed
+        self._posterior_cache: Dict[str, float] = {}
+        self._dirty: Set[str] = set()
+        # hypothesis -> (frozen_logL, frozen_log_notL, frozen_at, frozen_count)
+        self._accum: Dict[str, Tuple[float, float, float, int]] = {}
         
     def set_prior(self, hypothesis: str, probability: float, evidence_strength: float = 1.0):
         """Set prior probability for hypothesis"""
@@ -35,73 +126,175 @@ class BayesianEngine:
             evidence_strength=evidence_strength,
             last_updated=time.time()
         )
+        self._dirty.add(hypothesis)
         
     def add_evidence(self, hypothesis: str, evidence_id: str, likelihood: float, 
                     source: str = "unknown", reliability: float = 1.0):
         """Add evidence for hypothesis"""
-        evidence = BayesianEvidence(
-            evidence_id=evidence_id,
-            likelihood=likelihood,
-            timestamp=time.time(),
-            source=source,
-            reliability=reliability
-        )
-        
-        self.evidence_history[hypothesis].append(evidence)
+        now = time.time()
+        store = self.evidence_history[hypothesis]
+        if store.full:
+            self._fold_oldest_evidence(hypothesis, store, now)
+        store.append(evidence_id, likelihood, now, source, reliability)
+        self._dirty.add(hypothesis)
         
         # Update hypothesis tracking
         if hypothesis not in self.hypothesis_tracking:
             self.hypothesis_tracking[hypothesis] = {
                 'success_count': 0,
                 'total_count': 0,
-                'recent_performance': deque(maxlen=100)
+                # Ring buffer of the last RECENT_WINDOW outcomes with a running sum
+                'recent_performance': {
+                    'buf': np.zeros(RECENT_WINDOW, dtype=np.float32),
+                    'cursor': 0,
+                    'count': 0,
+                    'sum': 0.0,
+                }
             }
     
-    def calculate_posterior(self, hypothesis: str) -> Optional[float]:
+    def _fold_oldest_evidence(self, hypothesis: str, store: EvidenceStore, now: float):
+        """Compress the oldest quarter of a full store into its folded log-likelihood sums"""
+        count = max(1, store.capacity // 4)
+        logL, log_notL = self._log_likelihood_terms(store, 0, count, now)
+        store.drop_oldest(count, logL, log_notL)
+        # Frozen sums index rows of the store, which just shifted
+        self._accum.pop(hypothesis, None)
+
+    def calculate_posterior(self, hypothesis: str, current_time: Optional[float] = None) -> Optional[float]:
         """Calculate posterior probability using Bayes' theorem"""
         if hypothesis not in self.priors:
             return None
+        # Evidence decays with a one-day half-life, so a cached value only drifts
+        # negligibly between mutations.
+        if hypothesis not in self._dirty and hypothesis in self._posterior_cache:
+            return self._posterior_cache[hypothesis]
             
-        prior = self.priors[hypothesis]
-        evidence_list = self.evidence_history[hypothesis]
-        
-        if not evidence_list:
-            return prior.prior_probability
-            
-        # Calculate likelihood of all evidence
-        total_likelihood = 1.0
-        for evidence in evidence_list:
-            # Weight by reliability and recency
-            time_decay = self._calculate_time_decay(evidence.timestamp)
-            weight = evidence.reliability * time_decay
-            weighted_likelihood = evidence.likelihood * weight + (1 - weight) * 0.5
-            total_likelihood *= weighted_likelihood
-            
-        # Normalize
-        prior_prob = prior.prior_probability
-        marginal_probability = prior_prob * total_likelihood + (1 - prior_prob) * (1 - total_likelihood)
-        
-        if marginal_probability == 0:
-            return prior_prob
-            
-        posterior = (prior_prob * total_likelihood) / marginal_probability
-        return min(1.0, max(0.0, posterior))
+        now = time.time() if current_time is None else current_time
+        posterior = self._compute_posterior(hypothesis, now)
+        self._posterior_cache[hypothesis] = posterior
+        self._dirty.discard(hypothesis)
+        return posterior
+    
+    def _compute_posterior(self, hypothesis: str, now: float) -> float:
+        return self._compute_posteriors([hypothesis], now)[hypothesis]
+
+    def _compute_posteriors(self, hypotheses: List[str], now: float) -> Dict[str, float]:
+        """Posteriors for several hypotheses with one batched likelihood kernel"""
+        results: Dict[str, float] = {}
+        pending = []
+        for hypothesis in hypotheses:
+            columns = self.evidence_history.get(hypothesis)
+            if columns is None or (columns.size == 0 and columns.folded_count == 0):
+                results[hypothesis] = self.priors[hypothesis].prior_probability
+                continue
+            # Only evidence past the frozen cutoff is re-weighted; older rows contribute
+            # their folded log-likelihood sums.
+            frozen = self._accum.get(hypothesis, (0.0, 0.0, now, 0))
+            if now - frozen[2] > FROZEN_MAX_AGE:
+                frozen = (0.0, 0.0, now, 0)
+            pending.append((hypothesis, columns, frozen))
+        if not pending:
+            return results
+
+        # Ragged active ranges padded into dense (H, tile) arrays, one evidence tile at a time
+        width = max(columns.size - frozen[3] for _, columns, frozen in pending)
+        active_logL = np.zeros(len(pending))
+        active_log_notL = np.zeros(len(pending))
+        for offset in range(0, width, EVIDENCE_TILE):
+            tile = min(EVIDENCE_TILE, width - offset)
+            likelihood = np.full((len(pending), tile), 0.5)
+            timestamp = np.full((len(pending), tile), now)
+            reliability = np.zeros((len(pending), tile))
+            mask = np.zeros((len(pending), tile), dtype=bool)
+            for i, (_, columns, frozen) in enumerate(pending):
+                start = frozen[3] + offset
+                stop = min(start + tile, columns.size)
+                if stop <= start:
+                    continue
+                likelihood[i, :stop - start] = columns.likelihood[start:stop]
+                timestamp[i, :stop - start] = columns.timestamp[start:stop]
+                reliability[i, :stop - start] = columns.reliability[start:stop]
+                mask[i, :stop - start] = True
+            tile_logL, tile_log_notL = self._batched_log_likelihoods(
+                likelihood, timestamp, reliability, mask, now
+            )
+            active_logL += tile_logL
+            active_log_notL += tile_log_notL
+
+        priors = np.array([self.priors[h].prior_probability for h, _, _ in pending])
+        log_likelihood = np.empty(len(pending))
+        log_not_likelihood = np.empty(len(pending))
+        for i, (hypothesis, columns, frozen) in enumerate(pending):
+            frozen_logL, frozen_log_notL, frozen_at, frozen_count = frozen
+            logL = frozen_logL + float(active_logL[i])
+            log_notL = frozen_log_notL + float(active_log_notL[i])
+            if columns.size - frozen_count > ACTIVE_EVIDENCE_WINDOW:
+                self._accum[hypothesis] = (logL, log_notL, frozen_at, columns.size)
+            log_likelihood[i] = logL + columns.folded_logL
+            log_not_likelihood[i] = log_notL + columns.folded_log_notL
+
+        # Normalize via log-sum-exp over the two competing explanations; degenerate
+        # priors pass through clamped.
+        interior = (priors > 0.0) & (priors < 1.0)
+        safe = np.where(interior, priors, 0.5)
+        log_odds = (np.log1p(-safe) + log_not_likelihood) - (np.log(safe) + log_likelihood)
+        posteriors = np.clip(np.where(interior, np.exp(-np.logaddexp(0.0, log_odds)), priors), 0.0, 1.0)
+        for (hypothesis, _, _), posterior in zip(pending, posteriors.tolist()):
+            results[hypothesis] = posterior
+        return results
+
+    @staticmethod
+    def _batched_log_likelihoods(likelihood: np.ndarray, timestamp: np.ndarray,
+                                 reliability: np.ndarray, mask: Optional[np.ndarray],
+                                 now: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Row sums of log(wl) and log(1 - wl) over (H, E) evidence arrays, optionally masked"""
+        # Weight by reliability and recency; log space keeps long runs from underflowing
+        time_decay = 0.5 ** ((now - timestamp) / EVIDENCE_HALF_LIFE)
+        weight = reliability * time_decay
+        weighted_likelihood = likelihood * weight + (1 - weight) * 0.5
+        log_likelihood = np.log(np.clip(weighted_likelihood, 1e-300, 1.0))
+        log_not_likelihood = np.log(np.clip(1 - weighted_likelihood, 1e-300, 1.0))
+        if mask is not None:
+            log_likelihood = np.where(mask, log_likelihood, 0.0)
+            log_not_likelihood = np.where(mask, log_not_likelihood, 0.0)
+        return log_likelihood.sum(axis=1), log_not_likelihood.sum(axis=1)
+    
+    def _log_likelihood_terms(self, columns: EvidenceStore, start: int, stop: int,
+                              now: float) -> Tuple[float, float]:
+        """Sum log(wl) and log(1 - wl) over evidence rows [start, stop)"""
+        log_likelihood = log_not_likelihood = 0.0
+        # Fixed-size tiles keep the temporaries cache-resident for very long histories
+        for tile_start in range(start, stop, EVIDENCE_TILE):
+            tile = slice(tile_start, min(tile_start + EVIDENCE_TILE, stop))
+            tile_logL, tile_log_notL = self._batched_log_likelihoods(
+                columns.likelihood[None, tile], columns.timestamp[None, tile],
+                columns.reliability[None, tile], None, now
+            )
+            log_likelihood += float(tile_logL[0])
+            log_not_likelihood += float(tile_log_notL[0])
+        return log_likelihood, log_not_likelihood
     
     def update_with_outcome(self, hypothesis: str, success: bool, weight: float = 1.0):
         """Update prior based on outcome"""
         if hypothesis not in self.hypothesis_tracking:
             return
+        self._dirty.add(hypothesis)
             
         tracking = self.hypothesis_tracking[hypothesis]
         tracking['total_count'] += 1
-        tracking['recent_performance'].append(1.0 if success else 0.0)
+        recent = tracking['recent_performance']
+        outcome = 1.0 if success else 0.0
+        recent['sum'] += outcome - float(recent['buf'][recent['cursor']])
+        recent['buf'][recent['cursor']] = outcome
+        recent['cursor'] = (recent['cursor'] + 1) % RECENT_WINDOW
+        recent['count'] += 1
         
         if success:
             tracking['success_count'] += 1
             
         # Update prior using beta distribution
         success_rate = tracking['success_count'] / tracking['total_count']
-        recent_performance = np.mean(tracking['recent_performance']) if tracking['recent_performance'] else 0.5
+        recent_performance = recent['sum'] / min(recent['count'], RECENT_WINDOW) if recent['count'] else 0.5
         
         # Combine long-term and recent performance
         new_prior = 0.7 * success_rate + 0.3 * recent_performance
@@ -113,19 +306,16 @@ class BayesianEngine:
             self.priors[hypothesis].prior_probability = updated_prior
             self.priors[hypothesis].last_updated = time.time()
     
-    def _calculate_time_decay(self, evidence_timestamp: float, half_life: float = 24 * 3600) -> float:
-        """Calculate time decay factor for evidence"""
-        current_time = time.time()
-        time_diff = current_time - evidence_timestamp
-        decay_factor = 0.5 ** (time_diff / half_life)
-        return decay_factor
-    
     def get_competing_hypotheses(self, evidence: Dict[str, float]) -> List[Dict[str, Any]]:
         """Evaluate multiple hypotheses against same evidence"""
         results = []
+        now = time.time()
+        stale = [h for h in self.priors if h in self._dirty or h not in self._posterior_cache]
+        self._posterior_cache.update(self._compute_posteriors(stale, now))
+        self._dirty.difference_update(stale)
         
         for hypothesis in self.priors:
-            posterior = self.calculate_posterior(hypothesis)
+            posterior = self.calculate_posterior(hypothesis, now)
             if posterior is not None:
                 results.append({
                     'hypothesis': hypothesis,
@@ -141,14 +331,15 @@ class BayesianEngine:
         if hypothesis not in self.evidence_history:
             return {}
             
-        evidence_list = self.evidence_history[hypothesis]
-        recent_evidence = [e for e in evidence_list if time.time() - e.timestamp < 7 * 24 * 3600]
+        store = self.evidence_history[hypothesis]
+        n = store.size
+        now = time.time()
+        sources = Counter(store.source[:n].tolist())
         
         return {
-            'total_evidence': len(evidence_list),
-            'recent_evidence': len(recent_evidence),
-            'avg_likelihood': np.mean([e.likelihood for e in evidence_list]) if evidence_list else 0,
-            'avg_reliability': np.mean([e.reliability for e in evidence_list]) if evidence_list else 0,
-            'most_common_source': max(set([e.source for e in evidence_list]), 
-                                    key=[e.source for e in evidence_list].count) if evidence_list else "none"
-        }
\ No newline at end of file
+            'total_evidence': n,
+            'recent_evidence': int(np.count_nonzero(now - store.timestamp[:n] < 7 * 24 * 3600)),
+            'avg_likelihood': store.likelihood[:n].mean() if n else 0,
+            'avg_reliability': store.reliability[:n].mean() if n else 0,
+            'most_common_source': sources.most_common(1)[0][0] if n else "none"
+        }
@@ -1,5 +1,7 @@
 import json
 import hashlib
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
@@ -7,6 +9,8 @@ from typing import Dict, Any
 class FourMindTribunal:
     """Loads four epistemic perspectives and produces deterministic shadow traces."""
 
+    SHADOW_CACHE_SIZE = 4096
+
     def __init__(self, skg_path: str = None):
         base = Path(skg_path) if skg_path else Path(__file__).resolve().parent
         self.minds = {
@@ -15,8 +19,16 @@ class FourMindTribunal:
             "kant": self._load_mind(base / "ikant" / "kant_critical_skg.json"),
             "spinoza": self._load_mind(base / "bspinoza" / "spinoza_monism_skg.json"),
         }
+        self._shadow_cache: "OrderedDict[str, Dict[str, Dict[str, Any]]]" = OrderedDict()
 
     def _load_mind(self, path: Path) -> Dict[str, Any]:
+        return self._read_mind(str(path))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _read_mind(path_str: str) -> Dict[str, Any]:
+        """Parse a mind's SKG once per process; instances share the parsed payload."""
+        path = Path(path_str)
         if path.exists():
             with open(path, "r", encoding="utf-8") as f:
                 return json.load(f)
@@ -25,13 +37,22 @@ class FourMindTribunal:
     def generate_epistemic_shadow(self, stimulus: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """Return deterministic confidence traces for each mind."""
         canonical = json.dumps(stimulus, sort_keys=True)
-        base_hash = int(hashlib.sha256(canonical.encode()).hexdigest(), 16)
+        cached = self._shadow_cache.get(canonical)
+        if cached is not None:
+            self._shadow_cache.move_to_end(canonical)
+            return {mind: dict(trace) for mind, trace in cached.items()}
+
+        digest = hashlib.blake2b(canonical.encode(), digest_size=16).digest()
         shadows = {}
         for idx, (mind, payload) in enumerate(self.minds.items()):
-            confidence = ((base_hash >> (idx * 8)) & 0xFF) / 255
+            confidence = digest[idx] / 255
             shadows[mind] = {
                 "confidence": round(0.5 + 0.5 * confidence, 3),
                 "reference": payload.get("id", mind),
                 "domain": payload.get("domain", "unknown"),
             }
-        return shadows
+
+        self._shadow_cache[canonical] = shadows
+        if len(self._shadow_cache) > self.SHADOW_CACHE_SIZE:
+            self._shadow_cache.popitem(last=False)
+        return {mind: dict(trace) for mind, trace in shadows.items()}
@@ -1,8 +1,13 @@
+import hashlib
+import json
+import logging
 import math
-import random
-from typing import Dict, List, Tuple
+import numpy as np
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
+log = logging.getLogger(__name__)
+
 @dataclass
 class HLSFNode:
     """A coordinate in the High-Level Space Field"""
@@ -21,10 +26,14 @@ class HLSFNode:
         return self.n * base_adj
 
 class HLSFEngine:
+    _COLUMNS = ("_ids", "_n", "_k", "_load", "_adj", "_coords")
+
     def __init__(self, dimension: int = 18):
         self.dimension = dimension
-        self.field_map: Dict[str, HLSFNode] = {}
-        self.cursor_position = (0.0,) * dimension
+        # The dimension is fixed for the engine's lifetime; shape-dependent constants are built once
+        self.zero_vector: Tuple[float, ...] = (0.0,) * dimension
+        self.field_map: Dict[int, HLSFNode] = {}
+        self.cursor_position = self.zero_vector
         self.pulse_frequency = 0.0
         self.max_field_density = 1000
         self.purge_trigger_threshold = 800  # soft warning / purge trigger
@@ -34,19 +43,24 @@ class HLSFEngine:
         self.edge_cutter_active = False
         self.hysteresis_band = self.purge_trigger_threshold - self.purge_release_threshold
         self.last_density_breach = 0  # remembers last pre-purge density for causal enforcement
-        print(
-            f"Hysteresis active: trigger {self.purge_trigger_threshold} → release {self.purge_release_threshold} "
-            f"(band: {self.hysteresis_band} nodes) | Hard cap: {self.max_field_density}"
+        # Struct-of-arrays mirror of field_map (same row order) for vectorized sweeps
+        self._reset_store(64)
+        log.info(
+            "Hysteresis active: trigger %d → release %d (band: %d nodes) | Hard cap: %d",
+            self.purge_trigger_threshold,
+            self.purge_release_threshold,
+            self.hysteresis_band,
+            self.max_field_density,
         )
         
     def map_adjacency(self, stimulus: dict) -> HLSFNode:
         """Map stimulus to HLSF coordinate space with edge-cutter guardrails."""
-        stimulus_hash = str(hash(str(stimulus)))[-8:]
-        n_val = int(stimulus_hash[:4]) % self.dimension + 1
-        k_val = int(stimulus_hash[4:]) % 10 + 1
+        digest = self._stimulus_digest(stimulus)
+        n_val = int.from_bytes(digest[:2], "little") % self.dimension + 1
+        k_val = int.from_bytes(digest[2:4], "little") % 10 + 1
         
-        coords = self._generate_coordinates(stimulus)
-        node_id = f"NODE_{n_val}_{k_val}_{hash(coords)}"
+        coords = self._generate_coordinates(stimulus, digest)
+        node_id = int.from_bytes(digest[4:12], "little", signed=True)
         
         node_obj = None
         if node_id not in self.field_map:
@@ -60,6 +74,7 @@ class HLSFEngine:
                 cognitive_load=min(initial_vivacity, 10.0)
             )
             self.field_map[node_id] = node
+            self._append_row(node_id, node)
             node_obj = node
         else:
             node = self.field_map[node_id]
@@ -75,6 +90,9 @@ class HLSFEngine:
             )
             if repetition_count <= 2 and node.cognitive_load < 1.5:
                 node.cognitive_load = 1.5  # Prevent premature purge of newborn nodes
+            row = self._rows[node_id]
+            self._load[row] = node.cognitive_load
+            node.cognitive_load = float(self._load[row])  # node mirrors the float32 store
             node_obj = node
 
         current_density = len(self.field_map)
@@ -90,12 +108,11 @@ class HLSFEngine:
 
         if should_purge:
             self.last_density_breach = current_density
-            print(
-                "⚠️  Density warning: {}/{} (release {}). Triggering edge-cutter...".format(
-                    current_density,
-                    self.purge_trigger_threshold,
-                    self.purge_release_threshold,
-                )
+            log.warning(
+                "⚠️  Density warning: %d/%d (release %d). Triggering edge-cutter...",
+                current_density,
+                self.purge_trigger_threshold,
+                self.purge_release_threshold,
             )
             # Preserve the current node across purge so callers never see a missing key.
             self._edge_cutter_purge(preserve_node_id=node_id, preserve_node=self.field_map.get(node_id))
@@ -103,61 +120,118 @@ class HLSFEngine:
         # After purge, the just-touched node might have been removed; reinsert if needed to prevent KeyError.
         node_ref = self.field_map.get(node_id)
         if node_ref is None and node_obj is not None:
-            print(f"DEBUG: Node {node_id} purged during add — recreating")
+            log.debug("Node %d purged during add — recreating", node_id)
             self.field_map[node_id] = node_obj
+            self._append_row(node_id, node_obj)
             node_ref = node_obj
 
         return node_ref
     
     def get_recursive_neighbors(self, center_node: HLSFNode, radius: int = 3) -> List[HLSFNode]:
-        """Retrieve adjacent nodes; sample when dense to avoid O(n) blowups."""
-        if len(self.field_map) > 500:
-            return self._sampled_neighbors(center_node, radius, sample_size=100)
-
-        neighbors = []
-        for node in self.field_map.values():
-            if node == center_node:
-                continue
-            adjacency = center_node.recursive_adjacency(node)
-            if 0 < adjacency <= radius:
-                neighbors.append(node)
-        neighbors.sort(key=lambda x: center_node.recursive_adjacency(x))
-        return neighbors[:10]
-
-    def _sampled_neighbors(self, center_node: HLSFNode, radius: int, sample_size: int) -> List[HLSFNode]:
-        samples = random.sample(list(self.field_map.values()), min(sample_size, len(self.field_map)))
-        neighbors = [n for n in samples if n != center_node and 0 < center_node.recursive_adjacency(n) <= radius]
-        return sorted(neighbors, key=lambda x: center_node.recursive_adjacency(x))[:5]
+        """Retrieve adjacent nodes with a full vectorized scan of the field."""
+        rows = np.arange(len(self._nodes))
+        adjacency = self._adjacency_from(center_node, rows)
+        in_radius = (adjacency > 0) & (adjacency <= radius)
+        rows, adjacency = rows[in_radius], adjacency[in_radius]
+        nearest = rows[np.argsort(adjacency, kind="stable")[:10]]
+        return [self._nodes[row] for row in nearest.tolist()]
+
+    def _adjacency_from(self, center_node: HLSFNode, rows: np.ndarray) -> np.ndarray:
+        """Vectorized HLSFNode.recursive_adjacency from center_node to the given store rows."""
+        if center_node.n == 0 or center_node.k == 0:
+            return np.zeros(len(rows))
+        n_diff = np.abs(self._n[rows] - center_node.n)
+        k_diff = np.abs(self._k[rows] - center_node.k)
+        return center_node.n * n_diff * np.exp(-k_diff)
+
+    def _reset_store(self, capacity: int) -> None:
+        self._nodes: List[HLSFNode] = []
+        self._rows: Dict[int, int] = {}  # node id -> row
+        self._node_rows: Dict[int, int] = {}  # id(node) -> row
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        # n <= dimension and k <= 10, and loads are bounded in [0, 10]: narrow dtypes
+        # halve the bandwidth of neighbor scans and purge selection.
+        self._n = np.zeros(capacity, dtype=np.int16)
+        self._k = np.zeros(capacity, dtype=np.int16)
+        self._load = np.zeros(capacity, dtype=np.float32)
+        self._adj = np.zeros(capacity, dtype=np.float32)
+        self._coords = np.zeros((capacity, self.dimension), dtype=np.float32)
+
+    def _append_row(self, node_id: int, node: HLSFNode) -> None:
+        row = len(self._nodes)
+        if row == len(self._load):
+            self._grow_store(2 * row)
+        self._n[row] = node.n
+        self._k[row] = node.k
+        self._load[row] = node.cognitive_load
+        node.cognitive_load = float(self._load[row])
+        self._adj[row] = node.adjacency_value
+        self._coords[row, :len(node.coordinates)] = node.coordinates[:self.dimension]
+        self._ids[row] = node_id
+        self._nodes.append(node)
+        self._rows[node_id] = row
+        self._node_rows[id(node)] = row
+
+    def _grow_store(self, capacity: int) -> None:
+        size = len(self._nodes)
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:size] = column[:size]
+            setattr(self, name, grown)
+
+    def _compact_store(self, rows: np.ndarray) -> None:
+        """Keep only the given rows (in that order) and rebuild field_map from them."""
+        size = len(rows)
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            gathered = np.zeros((max(64, size),) + column.shape[1:], dtype=column.dtype)
+            gathered[:size] = column[rows]
+            setattr(self, name, gathered)
+        self._nodes = [self._nodes[row] for row in rows.tolist()]
+        ids = self._ids[:size].tolist()
+        self._rows = {node_id: row for row, node_id in enumerate(ids)}
+        self._node_rows = {id(node): row for row, node in enumerate(self._nodes)}
+        self.field_map = dict(zip(ids, self._nodes))
     
-    def _generate_coordinates(self, stimulus: dict) -> Tuple[float, ...]:
-        """Generate high-dimensional coordinates from stimulus hash"""
-        seed = str(stimulus)
-        coords = []
-        for i in range(self.dimension):
-            # Deterministic pseudo-random from seed
-            hash_val = hash(seed + str(i)) % 1000 / 1000.0
-            coords.append(hash_val * 2 - 1)  # Normalize to -1, 1
-        return tuple(coords)
+    @staticmethod
+    def _stimulus_digest(stimulus: dict) -> bytes:
+        """Hash the canonical stimulus once; n, k, coordinates and node id are sliced from it"""
+        canonical = json.dumps(stimulus, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(canonical, digest_size=32).digest()
+
+    def _generate_coordinates(self, stimulus: dict, digest: Optional[bytes] = None) -> Tuple[float, ...]:
+        """Generate high-dimensional coordinates from a stable stimulus digest"""
+        if digest is None:
+            digest = self._stimulus_digest(stimulus)
+        seed = int.from_bytes(digest[4:12], "little")
+        # One seeded PRNG fill for the whole vector, normalized to [-1, 1)
+        return tuple(np.random.default_rng(seed).uniform(-1, 1, self.dimension).tolist())
     
     def calculate_thought_vector(self, nodes: List[HLSFNode]) -> Tuple[float, ...]:
         """Compute emergent vector weighted by cognitive load."""
         if not nodes:
-            return (0.0,) * self.dimension
-
-        vector = [0.0] * self.dimension
-        total_weight = 0.0
+            return self.zero_vector
 
-        for node in nodes:
-            weight = node.cognitive_load * (1.0 + node.adjacency_value)
-            for i, coord in enumerate(node.coordinates):
-                if i < self.dimension:
-                    vector[i] += coord * weight
-            total_weight += weight
+        rows = [self._node_rows.get(id(node)) for node in nodes]
+        if None in rows:
+            # Nodes not resident in the field: gather their columns directly
+            coords = np.zeros((len(nodes), self.dimension))
+            for i, node in enumerate(nodes):
+                coords[i, :len(node.coordinates)] = node.coordinates[:self.dimension]
+            loads = np.fromiter((node.cognitive_load for node in nodes), dtype=float, count=len(nodes))
+            adjs = np.fromiter((node.adjacency_value for node in nodes), dtype=float, count=len(nodes))
+        else:
+            idx = np.array(rows, dtype=np.int64)
+            coords, loads, adjs = self._coords[idx], self._load[idx], self._adj[idx]
 
+        weights = loads * (1.0 + adjs)
+        vector = weights @ coords
+        total_weight = weights.sum()
         if total_weight > 0:
-            vector = [v / total_weight for v in vector]
+            vector = vector / total_weight
 
-        return tuple(vector)
+        return tuple(vector.tolist())
     
     def _edge_cutter_purge(self, preserve_node_id=None, preserve_node=None):
         """Sovereign forgetting: preserve top cognitive_load nodes and keep the current node resident."""
@@ -167,60 +241,71 @@ class HLSFEngine:
             return
 
         if current_density > self.max_field_density:
-            print(
-                f"⚠️ HARD CAP VIOLATION: {current_density}/{self.max_field_density} — forced purge"
+            log.warning(
+                "⚠️ HARD CAP VIOLATION: %d/%d — forced purge", current_density, self.max_field_density
             )
 
-        sorted_nodes = sorted(self.field_map.values(), key=lambda n: n.cognitive_load, reverse=True)
+        size = len(self._nodes)
+        load = self._load[:size]
 
         # Cap survivors below the release threshold so hysteresis can reset immediately after purge.
         soft_keep_cap = max(1, self.purge_release_threshold - 1)
         target_keep = min(
             max(int(self.max_field_density * self.purge_keep_ratio), 1),
             soft_keep_cap,
-            len(sorted_nodes),
+            size,
         )
 
         vivacity_floor = 1.5
-        keep_nodes = []
-        for n in sorted_nodes:
-            if n.cognitive_load >= vivacity_floor:
-                keep_nodes.append(n)
-            if len(keep_nodes) >= target_keep:
-                break
-
-        if len(keep_nodes) < max(1, target_keep // 2):
-            keep_nodes = sorted_nodes[:target_keep]
-
-        avg_load_kept = (
-            sum(n.cognitive_load for n in keep_nodes) / len(keep_nodes)
-            if keep_nodes
-            else 0.0
-        )
-
-        # Ensure the just-touched node survives the purge to avoid KeyError in caller.
-        existing_ids = {f"NODE_{n.n}_{n.k}_{hash(n.coordinates)}" for n in keep_nodes}
-        if preserve_node_id and preserve_node:
-            if preserve_node_id not in existing_ids:
-                keep_nodes.insert(0, preserve_node)
-            else:
-                # Move the preserved node to the front to guarantee it survives slicing.
-                keep_nodes = [preserve_node] + [n for n in keep_nodes if f"NODE_{n.n}_{n.k}_{hash(n.coordinates)}" != preserve_node_id]
+        keep_rows = self._top_load_rows(np.flatnonzero(load >= vivacity_floor), target_keep)
+        if len(keep_rows) < max(1, target_keep // 2):
+            keep_rows = self._top_load_rows(np.arange(size), target_keep)
 
         # Rebuild the field map with survivors (cap at hard limit but also honor soft keep cap).
         max_allowed = min(self.max_field_density, soft_keep_cap)
-        self.field_map = {}
-        for n in keep_nodes[: max_allowed]:
-            new_id = f"NODE_{n.n}_{n.k}_{hash(n.coordinates)}"
-            self.field_map[new_id] = n
+        survivors = keep_rows
+        reinsert = None
+        # Ensure the just-touched node survives the purge to avoid KeyError in caller.
+        if preserve_node_id is not None and preserve_node is not None:
+            preserve_row = self._rows.get(preserve_node_id)
+            if preserve_row is not None:
+                # Move the preserved node to the front to guarantee it survives slicing.
+                survivors = np.concatenate(([preserve_row], keep_rows[keep_rows != preserve_row]))
+            else:
+                reinsert = preserve_node
+                max_allowed -= 1
+        self._compact_store(survivors[:max_allowed])
+        if reinsert is not None:
+            self.field_map[preserve_node_id] = reinsert
+            self._append_row(preserve_node_id, reinsert)
 
-        purged = current_density - len(self.field_map)
         self.edge_cutter_active = True
-        print(
-            f"⚡ EDGE-CUTTER: purged={purged} | kept={len(self.field_map)} | "
-            f"new_density={len(self.field_map)} | avg_load_kept={avg_load_kept:.2f} | "
-            f"band={self.hysteresis_band} (trigger={self.purge_trigger_threshold}, release={self.purge_release_threshold})"
-        )
+        if log.isEnabledFor(logging.INFO):
+            avg_load_kept = float(load[keep_rows].mean()) if len(keep_rows) else 0.0
+            log.info(
+                "⚡ EDGE-CUTTER: purged=%d | kept=%d | new_density=%d | avg_load_kept=%.2f | "
+                "band=%d (trigger=%d, release=%d)",
+                current_density - len(self.field_map),
+                len(self.field_map),
+                len(self.field_map),
+                avg_load_kept,
+                self.hysteresis_band,
+                self.purge_trigger_threshold,
+                self.purge_release_threshold,
+            )
+
+    def _top_load_rows(self, rows: np.ndarray, k: int) -> np.ndarray:
+        """Rows with the k highest loads, highest first; ties keep insertion order."""
+        if k <= 0 or len(rows) == 0:
+            return rows[:0]
+        values = self._load[rows]
+        if len(rows) > k:
+            threshold = -np.partition(-values, k - 1)[k - 1]
+            above = values > threshold
+            ties = np.flatnonzero(values == threshold)[: k - int(above.sum())]
+            chosen = np.sort(np.concatenate([np.flatnonzero(above), ties]))
+            rows, values = rows[chosen], values[chosen]
+        return rows[np.lexsort((rows, -values))]
 
     def pulse(self) -> dict:
         self.pulse_frequency = (self.pulse_frequency + 0.1) % (2 * math.pi)
@@ -232,8 +317,10 @@ class HLSFEngine:
 
     def decay_vivacity(self, decay_factor: float = 0.99, floor: float = 0.5) -> None:
         """Slow natural fade of cognitive_load to allow true forgetting during idle periods."""
-        for node in self.field_map.values():
-            node.cognitive_load = max(node.cognitive_load * decay_factor, floor)
+        size = len(self._nodes)
+        self._load[:size] = np.maximum(self._load[:size] * decay_factor, floor)
+        for node, load in zip(self._nodes, self._load[:size].tolist()):
+            node.cognitive_load = load
 
 # Singleton instance for ORB controller
 hlsf_singleton = HLSFEngine(dimension=18)
\ No newline at end of file
@@ -1,50 +1,117 @@
 import sys
 import math
 import os
-from collections import deque
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Optional, Tuple
+import numpy as np
 from PySide6.QtWidgets import (QApplication, QWidget, QGraphicsDropShadowEffect, 
                                 QLabel, QVBoxLayout, QHBoxLayout)
-from PySide6.QtCore import (Qt, QTimer, QPoint, Signal, QObject, QThread, 
-                           QRect, QPointF)
-from PySide6.QtGui import QColor, QPainter, QBrush, QPen, QFont, QCursor, QRadialGradient
+from PySide6.QtCore import (Qt, QTimer, QPoint, Signal, Slot, QObject, QThread, 
+                           QRect, QPointF, QMetaObject, Q_ARG)
+from PySide6.QtGui import QColor, QPainter, QBrush, QPen, QFont, QCursor, QRadialGradient, QPixmap
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from orb_controller import SF_ORB_Controller
 
+MAX_CURSOR_VELOCITY = 50.0
+
+# Humean prediction: orb lead offset per predicted quadrant
+_QUAD_OFFSETS = {
+    "NW": QPoint(-60, -60),
+    "NE": QPoint(60, -60),
+    "SW": QPoint(-60, 60),
+    "SE": QPoint(60, 60),
+}
+_ZERO = QPoint(0, 0)
+
+class Mode(IntEnum):
+    GUARD = 0
+    GUARD_HABIT = 1
+    HABIT = 2
+    JUMP = 3
+
+# Mode colors indexed by Mode; pulses resolve their mode string once in handle_pulse
+_MODE_COLORS_T = (
+    QColor(0, 128, 128),   # Teal
+    QColor(64, 160, 100),  # Teal-Green
+    QColor(255, 191, 0),   # Amber
+    QColor(143, 0, 255),   # Violet
+)
+_MODE_FROM_STR = {"GUARD": 0, "GUARD-HABIT": 1, "HABIT": 2, "INTUITION-JUMP": 3}
+
+# Per-frame lerp factors for the [r, g, b, x, y] orb state
+_LERP_DEFAULT = np.array([0.1, 0.1, 0.1, 0.08, 0.08], dtype=np.float32)
+_LERP_HABIT = np.array([0.1, 0.1, 0.1, 0.15, 0.15], dtype=np.float32)
+_LERP_SNAP = np.array([0.1, 0.1, 0.1, 1.0, 1.0], dtype=np.float32)
+
+def cursor_velocity(x, y, last_x, last_y, dt):
+    """Capped cursor speed in px/s between two samples dt seconds apart."""
+    speed = math.hypot(x - last_x, y - last_y) / (dt if dt > 0.001 else 0.001)
+    return speed if speed < MAX_CURSOR_VELOCITY else MAX_CURSOR_VELOCITY
+
+@dataclass(slots=True)
+class PulseView:
+    """The slice of a thought pulse the orb renders, sent from worker to GUI"""
+    mode: str
+    glow: float
+    field_density: int
+    proc_time_ms: float
+    edge_cutter_active: bool
+    predictive_target: Optional[str]
+    jump_vector: Optional[Tuple[float, float]]
+
+    @classmethod
+    def from_pulse(cls, pulse):
+        pred = pulse.get("predictive_intent") or {}
+        jump_vec = pulse.get("jump_vector") or None
+        return cls(
+            mode=pulse.get("cognitive_mode", "GUARD"),
+            glow=pulse.get("glow_intensity", 0.5),
+            field_density=pulse.get("field_density", 0),
+            proc_time_ms=pulse.get("proc_time_ms", 0.0),
+            edge_cutter_active=pulse.get("edge_cutter_active", False),
+            predictive_target=pred.get("target"),
+            jump_vector=(jump_vec[0], jump_vec[1]) if jump_vec else None,
+        )
+
 class CognitiveWorker(QObject):
     """Background thread for cognitive processing"""
-    pulse_signal = Signal(dict)
+    pulse_signal = Signal(object)
     
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
         self.running = True
-        self.last_pos = QPoint(0, 0)
-        self.last_time = 0
+        self.last_x, self.last_y = 0, 0
+        self.last_time = time.perf_counter()
         
+    @Slot(QPoint)
     def process_cursor(self, pos):
         if not self.running:
             return
             
         # Calculate velocity
-        current_time = os.times().system
-        dx = pos.x() - self.last_pos.x()
-        dy = pos.y() - self.last_pos.y()
-        dt = current_time - self.last_time if self.last_time > 0 else 0.016
-        velocity = math.sqrt(dx*dx + dy*dy) / max(dt, 0.001)
+        now = time.perf_counter()
+        x, y = pos.x(), pos.y()
+        dt = now - self.last_time
+        velocity = cursor_velocity(x, y, self.last_x, self.last_y, dt)
         
-        self.last_pos = pos
-        self.last_time = current_time
+        self.last_x, self.last_y = x, y
+        self.last_time = now
         
         stimulus = {
             "type": "cursor_movement",
-            "coordinates": [pos.x(), pos.y()],
-            "velocity": min(velocity, 50.0),  # Cap velocity
+            "coordinates": [x, y],
+            "velocity": velocity,
             "intent": "navigation"
         }
         
         thought = self.controller.cognitively_emerge(stimulus)
         if thought:
-            self.pulse_signal.emit(thought.pulse())
+            # A fresh view per emission: the queued slot reads it after this thread moves on
+            self.pulse_signal.emit(PulseView.from_pulse(thought.pulse()))
 
 class FloatingOrb(QWidget):
     def __init__(self):
@@ -66,32 +133,46 @@ class FloatingOrb(QWidget):
         screen = QApplication.primaryScreen().geometry()
         self.move(screen.center() - self.rect().center())
         
-        # State
-        self.current_pos = self.pos()
+        # Lerp state packed as [r, g, b, x, y]; one vector step per frame, no QPoints
         self.target_pos = self.pos()
-        self.true_target = self.pos()  # For lerp calculations
+        guard = _MODE_COLORS_T[Mode.GUARD]
+        self._state = np.array(
+            [guard.red(), guard.green(), guard.blue(), self.x(), self.y()], dtype=np.float32
+        )
+        self._target_state = self._state.copy()  # For lerp calculations
         
         # Cognitive state
         self.cognitive_mode = "GUARD"
+        self._mode_id = Mode.GUARD
         self.glow_intensity = 0.5
-        self.predictive_offset = QPoint(0, 0)
+        self.predictive_offset = _ZERO
         self.necessity_vector = (0.0, 0.0)
         self.jump_active = False
         self.field_density = 0
         self.edge_cutter_active = False
         self.purge_phase = 0
         self.proc_time_ms = 0.0
-        self.latency_samples = deque(maxlen=40)
-        
-        # Mode colors
-        self.colors = {
-            "GUARD": QColor(0, 128, 128),        # Teal
-            "GUARD-HABIT": QColor(64, 160, 100), # Teal-Green
-            "HABIT": QColor(255, 191, 0),        # Amber
-            "INTUITION-JUMP": QColor(143, 0, 255) # Violet
-        }
-        self.current_color = self.colors["GUARD"]
+        # Latency sparkline: fixed ring of the last 40 samples plus reusable points
+        self._lat = np.zeros(40, dtype=np.float32)
+        self._lat_head = 0
+        self._lat_count = 0
+        self._lat_max = 0.0  # running max of the ring, rescanned only when the max is evicted
+        self._lat_run = 0  # consecutive identical samples; past 40 the sparkline is unchanged
+        self._lat_last = 0.0
+        self._spark_points = [QPointF() for _ in range(40)]
+        
+        # One persistent QColor mirrored from the lerp state via setRgb()
+        self._color_cache = QColor(guard)
+        self.current_color = self._color_cache
+        self._shock_pen_color = QColor(238, 130, 238)
+        self._shock_fill_color = QColor(238, 130, 238)
+        self._pulse_color = QColor()
+        # Pre-rendered orb body (gradient + inner core) keyed by quantized color
+        self._orb_cache: "OrderedDict[int, QPixmap]" = OrderedDict()
         self.pulse_phase = 0
+        self._dirty_visual = True  # pulse state changed since the last paint
+        self._dirty_pos = False  # widget translated this frame (no repaint needed for that alone)
+        self._rebuild_layers()
         
         # Setup worker thread
         self.worker_thread = QThread()
@@ -99,11 +180,7 @@ class FloatingOrb(QWidget):
         self.worker.moveToThread(self.worker_thread)
         self.worker.pulse_signal.connect(self.handle_pulse)
         
-        # Timers
-        self.track_timer = QTimer()
-        self.track_timer.timeout.connect(self.track_cursor)
-        self.track_timer.start(16)  # 60fps tracking
-        
+        # Timers (cursor tracking rides on the 60fps animation tick)
         self.anim_timer = QTimer()
         self.anim_timer.timeout.connect(self.update_animation)
         self.anim_timer.start(16)
@@ -113,12 +190,16 @@ class FloatingOrb(QWidget):
         self.cognitive_timer.start(100)  # 10Hz cognition
         
         self.last_cursor = QCursor.pos()
+        self._cursor_dirty = True  # cursor moved since the last cognition cycle
+        self._last_cog_x, self._last_cog_y = -9999, -9999  # cursor at the last forwarded cycle
         self.setup_ui()
         self.worker_thread.start()
         
     def setup_ui(self):
         self.shadow = QGraphicsDropShadowEffect(self)
         self.shadow.setBlurRadius(30)
+        self._blur_radius = 30
+        self._still_frames = 0
         self.shadow.setColor(self.current_color)
         self.shadow.setOffset(0, 0)
         self.setGraphicsEffect(self.shadow)
@@ -138,122 +219,243 @@ class FloatingOrb(QWidget):
         self.hud.hide()
         
     def track_cursor(self):
-        self.last_cursor = QCursor.pos()
+        pos = QCursor.pos()
+        if pos != self.last_cursor:
+            self.last_cursor = pos
+            self._cursor_dirty = True
         
     def process_cognition(self):
+        # Only think when the cursor actually moved since the last cycle
+        if not self._cursor_dirty:
+            return
+        # 3px dead-zone while guarding: jitter does not wake the worker
+        c = self.last_cursor
+        dx, dy = c.x() - self._last_cog_x, c.y() - self._last_cog_y
+        if dx * dx + dy * dy < 9 and not self.jump_active and self._mode_id == Mode.GUARD:
+            return
         if self.worker_thread.isRunning():
-            self.worker.process_cursor(self.last_cursor)
+            self._cursor_dirty = False
+            self._last_cog_x, self._last_cog_y = c.x(), c.y()
+            # Queued so the controller runs on the worker thread, not the GUI thread
+            QMetaObject.invokeMethod(
+                self.worker, "process_cursor", Qt.ConnectionType.QueuedConnection, Q_ARG(QPoint, c)
+            )
             
     def handle_pulse(self, pulse):
-        mode = pulse.get("cognitive_mode", "GUARD")
+        mode = pulse.mode
+        layers_stale = mode != self.cognitive_mode or pulse.edge_cutter_active != self.edge_cutter_active
         self.cognitive_mode = mode
-        self.glow_intensity = pulse.get("glow_intensity", 0.5)
-        self.field_density = pulse.get("field_density", 0)
-        self.proc_time_ms = pulse.get("proc_time_ms", 0.0)
-        self.edge_cutter_active = pulse.get("edge_cutter_active", False)
+        self._mode_id = _MODE_FROM_STR.get(mode, Mode.GUARD)
+        self.glow_intensity = pulse.glow
+        self.field_density = pulse.field_density
+        self.proc_time_ms = pulse.proc_time_ms
+        self.edge_cutter_active = pulse.edge_cutter_active
         
         # Handle Humean prediction
-        if mode in ["HABIT", "GUARD-HABIT"]:
-            pred = pulse.get("predictive_intent", {})
-            if pred and "target" in pred:
-                quad = pred["target"]
-                offsets = {"NW": (-60, -60), "NE": (60, -60), 
-                          "SW": (-60, 60), "SE": (60, 60)}
-                off = offsets.get(quad, (0, 0))
-                self.predictive_offset = QPoint(off[0], off[1])
-            else:
-                self.predictive_offset = QPoint(0, 0)
+        if self._mode_id in (Mode.HABIT, Mode.GUARD_HABIT):
+            self.predictive_offset = _QUAD_OFFSETS.get(pulse.predictive_target, _ZERO)
         else:
-            self.predictive_offset = QPoint(0, 0)
+            self.predictive_offset = _ZERO
             
         # Handle Spinozan jump
-        if mode == "INTUITION-JUMP":
-            jump_vec = pulse.get("jump_vector", [0, 0])
+        if self._mode_id == Mode.JUMP:
+            jump_vec = pulse.jump_vector
             if jump_vec and abs(jump_vec[0]) > 0.01:
                 screen = QApplication.primaryScreen().geometry()
                 center = screen.center()
                 # Map normalized vector to screen space (200px range)
                 target_x = center.x() + jump_vec[0] * 200 - 60
                 target_y = center.y() + jump_vec[1] * 200 - 60
-                self.true_target = QPoint(int(target_x), int(target_y))
+                self._target_state[3:] = (int(target_x), int(target_y))
                 self.jump_active = True
             self.pulse_phase = 0  # Reset pulse for shockwave
         else:
             self.jump_active = False
+            self.pulse_phase = 0  # shockwave only runs in JUMP; a stale phase would block idling
             # Normal following with prediction
-            self.true_target = self.last_cursor + self.predictive_offset - QPoint(60, 60)
+            self._target_state[3:] = (
+                self.last_cursor.x() + self.predictive_offset.x() - 60,
+                self.last_cursor.y() + self.predictive_offset.y() - 60,
+            )
             
+        if layers_stale:
+            self._rebuild_layers()
+        # Quantize to 4px steps so small glow changes don't regenerate the blur
+        blur = (int(20 + 60 * self.glow_intensity) // 4) * 4
+        if blur != self._blur_radius:
+            self._blur_radius = blur
+            self.shadow.setBlurRadius(blur)
         self.hud.setText(f"{mode}\n{self.glow_intensity:.2f}")
-        self.update()
+        # Repaint on the next animation tick rather than queueing one per pulse
+        self._dirty_visual = True
         
     def update_animation(self):
-        # Color lerp
-        target_color = self.colors.get(self.cognitive_mode, self.colors["GUARD"])
-        r = self.current_color.red() + (target_color.red() - self.current_color.red()) * 0.1
-        g = self.current_color.green() + (target_color.green() - self.current_color.green()) * 0.1
-        b = self.current_color.blue() + (target_color.blue() - self.current_color.blue()) * 0.1
-        self.current_color = QColor(int(r), int(g), int(b))
-        
-        # Shadow/glow
-        self.shadow.setColor(self.current_color)
-        base_blur = 20
-        blur = base_blur + (60 * self.glow_intensity)
-        self.shadow.setBlurRadius(int(blur))
-        
-        # Position handling
+        self.track_cursor()
+
+        target_color = _MODE_COLORS_T[self._mode_id]
+        self._target_state[:3] = (target_color.red(), target_color.green(), target_color.blue())
+        delta = self._target_state - self._state
+
+        # Idle orb: settled color and position and no shockwave running -> no repaint
+        if (
+            float(delta[3] * delta[3] + delta[4] * delta[4]) < 1
+            and float(np.abs(delta[:3]).sum()) < 2
+            and self.pulse_phase == 0
+            and self.purge_phase == 0
+            and self._mode_id != Mode.JUMP
+            and not self.edge_cutter_active
+        ):
+            if not self.shadow.isEnabled():
+                self.shadow.setEnabled(True)
+                self._still_frames = 0
+            if self._dirty_visual:
+                self.update()
+            return
+
+        # Color and position lerp in one step; jumps snap position (speed 1)
         if self.jump_active:
-            # Spinozan snap (instant)
-            self.current_pos = self.true_target
+            speed = _LERP_SNAP  # Spinozan snap (instant)
+        elif self._mode_id == Mode.HABIT:
+            speed = _LERP_HABIT  # Faster, eager
         else:
-            # Lerp based on mode
-            if self.cognitive_mode == "HABIT":
-                speed = 0.15  # Faster, eager
-            else:
-                speed = 0.08  # Slower, deliberate
-                
-            new_x = self.current_pos.x() + (self.true_target.x() - self.current_pos.x()) * speed
-            new_y = self.current_pos.y() + (self.true_target.y() - self.current_pos.y()) * speed
-            self.current_pos = QPoint(int(new_x), int(new_y))
-            
-        self.move(self.current_pos)
+            speed = _LERP_DEFAULT  # Slower, deliberate
+        self._state += delta * speed
+
+        r, g, b, x, y = self._state.tolist()
+        r, g, b, x, y = int(r), int(g), int(b), int(x), int(y)
+        cc = self._color_cache
+        if r != cc.red() or g != cc.green() or b != cc.blue():
+            cc.setRgb(r, g, b)
+            self.shadow.setColor(cc)
+            self._dirty_visual = True
+        # A pure move is recomposited by the window system; it needs no paintEvent
+        self._dirty_pos = x != self.x() or y != self.y()
+        if self._dirty_pos:
+            self.move(x, y)
+
+        # Drop the glow while the orb sweeps (>20px/frame); restore after 5 calmer frames
+        step_x, step_y = float(delta[3] * speed[3]), float(delta[4] * speed[4])
+        if step_x * step_x + step_y * step_y > 400:
+            self._still_frames = 0
+            if self.shadow.isEnabled():
+                self.shadow.setEnabled(False)
+        elif not self.shadow.isEnabled():
+            self._still_frames += 1
+            if self._still_frames >= 5:
+                self.shadow.setEnabled(True)
         
         # Pulse phase for intuition shockwave
-        if self.cognitive_mode == "INTUITION-JUMP":
+        if self._mode_id == Mode.JUMP:
             self.pulse_phase = (self.pulse_phase + 2) % 30
         elif self.edge_cutter_active:
             # Purge shockwave runs longer and independent of jump
-            self.purge_phase = min(self.purge_phase + 3, 120)
-        else:
-            self.purge_phase = max(self.purge_phase - 4, 0)
+            phase = self.purge_phase + 3
+            self.purge_phase = phase if phase < 120 else 120
+        elif self.purge_phase > 0:
+            phase = self.purge_phase - 4
+            self.purge_phase = phase if phase > 0 else 0
+            if self.purge_phase == 0:
+                self._rebuild_layers()  # purge shockwave fully faded out
 
         # Track latency samples for sparkline
-        self.latency_samples.append(float(self.proc_time_ms))
-            
-        self.update()
+        evicted = float(self._lat[self._lat_head])
+        self._lat[self._lat_head] = self.proc_time_ms
+        sample = float(self._lat[self._lat_head])  # compare at the ring's float32 precision
+        self._lat_head = (self._lat_head + 1) % 40
+        self._lat_run = self._lat_run + 1 if sample == self._lat_last else 1
+        self._lat_last = sample
+        if sample >= self._lat_max:
+            self._lat_max = sample
+        elif evicted == self._lat_max:
+            self._lat_max = float(self._lat.max())
+        if self._lat_count < 40:
+            self._lat_count += 1
+
+        if self._dirty_visual or self._lat_run <= 40 or self.pulse_phase or self.purge_phase:
+            self.update()
         
     def paintEvent(self, event):
+        self._dirty_visual = False
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
+        # Optional layers under the orb (shockwaves), chosen when state changes
+        for draw in self._under_layers:
+            draw(painter)
+        
+        # Main orb with gradient and inner core, blitted from the cache
+        painter.drawPixmap(0, 0, self._orb_pixmap())
+        
+        # Density ring (maps 0-1000 to arc) and hysteresis band (650-800)
+        density_ratio = self.field_density / 1000.0
+        density_ratio = 0.0 if density_ratio < 0.0 else (1.0 if density_ratio > 1.0 else density_ratio)
+        painter.setPen(QPen(QColor(0, 200, 200), 4))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawArc(6, 6, 108, 108, 90 * 16, -int(density_ratio * 360 * 16))
+
+        trigger, release = 800, 650
+        band_start = release / 1000.0 * 360.0
+        band_span = (trigger - release) / 1000.0 * 360.0
+        painter.setPen(QPen(QColor(120, 220, 120, 180), 3))
+        painter.drawArc(10, 10, 100, 100, int((90 - band_start) * 16), -int(band_span * 16))
+
+        # Latency sparkline (bottom area)
+        n = self._lat_count
+        if n:
+            # Oldest-first view of the ring, then all coordinates in two vector ops
+            samples = np.roll(self._lat, -self._lat_head)[40 - n:]
+            max_latency = self._lat_max if self._lat_max > 1.0 else 1.0
+            w = 80
+            h = 30
+            x0 = 20
+            y0 = 90
+            xs = x0 + np.arange(n) * (w / (n - 1 if n > 1 else 1))
+            ys = y0 + h - np.minimum(h, samples * (h / max_latency))
+            pts = self._spark_points[:n]
+            for pt, x, y in zip(pts, xs.tolist(), ys.tolist()):
+                pt.setX(x)
+                pt.setY(y)
+            painter.setPen(QPen(QColor(255, 90, 90), 2))
+            painter.drawPolyline(pts)
+
+        # Optional layers over the orb (mode indicator ring)
+        for draw in self._over_layers:
+            draw(painter)
+
+    def _rebuild_layers(self):
+        """Select the optional paint layers for the current mode and purge state."""
+        under = []
+        if self.edge_cutter_active or self.purge_phase > 0:
+            under.append(self._draw_purge)
+        if self._mode_id == Mode.JUMP:
+            under.append(self._draw_shockwave)
+        self._under_layers = tuple(under)
+        self._over_layers = (self._draw_habit_ring,) if self._mode_id == Mode.HABIT else ()
+
+    def _draw_purge(self, painter):
         # Purge shockwave effect when edge-cutter is active
         if self.purge_phase > 0:
-            alpha = max(0, 180 - self.purge_phase)
+            alpha = 180 - self.purge_phase
+            alpha = alpha if alpha > 0 else 0
             radius = 60 + self.purge_phase * 1.5
-            shock_color = QColor(238, 130, 238, alpha)
-            painter.setBrush(QBrush(QColor(238, 130, 238, max(10, alpha // 3))))
-            painter.setPen(QPen(shock_color, 3))
+            self._shock_pen_color.setAlpha(alpha)
+            fill_alpha = alpha // 3
+            self._shock_fill_color.setAlpha(fill_alpha if fill_alpha > 10 else 10)
+            painter.setBrush(QBrush(self._shock_fill_color))
+            painter.setPen(QPen(self._shock_pen_color, 3))
             painter.drawEllipse(int(60 - radius/2), int(60 - radius/2), int(radius), int(radius))
 
+    def _draw_shockwave(self, painter):
         # Shockwave effect for Intuition-Jump
-        if self.cognitive_mode == "INTUITION-JUMP" and self.pulse_phase > 0:
+        if self.pulse_phase > 0:
             alpha = int(255 * (1 - self.pulse_phase / 30))
-            pulse_color = QColor(
-                self.current_color.red(),
-                self.current_color.green(),
-                self.current_color.blue(),
+            self._pulse_color.setRgb(
+                self._color_cache.red(),
+                self._color_cache.green(),
+                self._color_cache.blue(),
                 alpha
             )
-            painter.setBrush(QBrush(pulse_color))
+            painter.setBrush(QBrush(self._pulse_color))
             painter.setPen(Qt.PenStyle.NoPen)
             radius = 60 + self.pulse_phase * 3
             painter.drawEllipse(
@@ -261,12 +463,33 @@ class FloatingOrb(QWidget):
                 int(60 - radius/2), 
                 radius, radius
             )
-        
+
+    def _draw_habit_ring(self, painter):
+        # Mode indicator ring
+        painter.setPen(QPen(_MODE_COLORS_T[Mode.HABIT], 3))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawEllipse(5, 5, 110, 110)
+            
+    def _orb_pixmap(self):
+        """Return the orb body for the current color, rendering it on a cache miss."""
+        r, g, b = self._color_cache.red() >> 3, self._color_cache.green() >> 3, self._color_cache.blue() >> 3
+        key = (r << 16) | (g << 8) | b
+        pixmap = self._orb_cache.get(key)
+        if pixmap is not None:
+            self._orb_cache.move_to_end(key)
+            return pixmap
+
+        color = QColor(r << 3, g << 3, b << 3)
+        pixmap = QPixmap(120, 120)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+
         # Main orb with gradient
         gradient = QRadialGradient(60, 60, 50)
-        gradient.setColorAt(0, self.current_color.lighter(150))
-        gradient.setColorAt(0.7, self.current_color)
-        gradient.setColorAt(1, self.current_color.darker(120))
+        gradient.setColorAt(0, color.lighter(150))
+        gradient.setColorAt(0.7, color)
+        gradient.setColorAt(1, color.darker(120))
         
         painter.setBrush(QBrush(gradient))
         painter.setPen(Qt.PenStyle.NoPen)
@@ -275,41 +498,13 @@ class FloatingOrb(QWidget):
         # Inner core
         painter.setBrush(QBrush(QColor(255, 255, 255, 100)))
         painter.drawEllipse(30, 30, 60, 60)
-        
-        # Density ring (maps 0-1000 to arc) and hysteresis band (650-800)
-        density_ratio = min(max(self.field_density / 1000.0, 0.0), 1.0)
-        painter.setPen(QPen(QColor(0, 200, 200), 4))
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawArc(6, 6, 108, 108, 90 * 16, -int(density_ratio * 360 * 16))
+        painter.end()
 
-        trigger, release = 800, 650
-        band_start = release / 1000.0 * 360.0
-        band_span = (trigger - release) / 1000.0 * 360.0
-        painter.setPen(QPen(QColor(120, 220, 120, 180), 3))
-        painter.drawArc(10, 10, 100, 100, int((90 - band_start) * 16), -int(band_span * 16))
-
-        # Latency sparkline (bottom area)
-        if self.latency_samples:
-            samples = list(self.latency_samples)
-            max_latency = max(max(samples), 1.0)
-            w = 80
-            h = 30
-            x0 = 20
-            y0 = 90
-            pts = []
-            for i, val in enumerate(samples):
-                x = x0 + (i / max(1, len(samples) - 1)) * w
-                y = y0 + h - min(h, (val / max_latency) * h)
-                pts.append(QPointF(x, y))
-            painter.setPen(QPen(QColor(255, 90, 90), 2))
-            painter.drawPolyline(pts)
+        self._orb_cache[key] = pixmap
+        if len(self._orb_cache) > 64:
+            self._orb_cache.popitem(last=False)
+        return pixmap
 
-        # Mode indicator ring
-        if self.cognitive_mode == "HABIT":
-            painter.setPen(QPen(self.colors["HABIT"], 3))
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawEllipse(5, 5, 110, 110)
-            
     def enterEvent(self, event):
         self.hud.show()
         
@@ -324,8 +519,9 @@ class FloatingOrb(QWidget):
     def mouseMoveEvent(self, event):
         if event.buttons() == Qt.MouseButton.LeftButton:
             self.move(event.globalPos() - self.drag_pos)
-            self.current_pos = self.pos()
-            self.true_target = self.pos()
+            self._state[3:] = (self.x(), self.y())
+            self._target_state[3:] = self._state[3:]
+            self._cursor_dirty = True
             event.accept()
             
     def closeEvent(self, event):
@@ -350,298 +546,5 @@ def main():
     
     sys.exit(app.exec())
 
-if __name__ == "__main__":
-    main()import sys
-import math
-from PySide6.QtWidgets import QApplication, QWidget, QGraphicsDropShadowEffect, QLabel, QVBoxLayout
-from PySide6.QtCore import Qt, QTimer, QPoint, QPropertyAnimation, QEasingCurve, Signal, QObject, QThread
-from PySide6.QtGui import QColor, QPainter, QBrush, QPen, QFont, QCursor
-import numpy as np
-
-# Import controller (adjust path if needed)
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from orb_controller import SF_ORB_Controller
-
-class CognitiveWorker(QObject):
-    """Background thread for cognitive processing to keep UI smooth"""
-    pulse_signal = Signal(dict)
-    
-    def __init__(self, controller):
-        super().__init__()
-        self.controller = controller
-        self.running = True
-        
-    def process_cursor(self, pos, velocity):
-        if not self.running:
-            return
-            
-        stimulus = {
-            "type": "cursor_movement",
-            "coordinates": [pos.x(), pos.y()],
-            "velocity": velocity,
-            "intent": "navigation"
-        }
-        
-        thought = self.controller.cognitively_emerge(stimulus)
-        if thought:
-            self.pulse_signal.emit(thought.pulse())
-
-class FloatingOrb(QWidget):
-    def __init__(self):
-        super().__init__()
-        self.controller = SF_ORB_Controller()
-        
-        # Window setup
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint | 
-                           Qt.WindowType.WindowStaysOnTopHint | 
-                           Qt.WindowType.Tool)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.setFixedSize(120, 120)
-        
-        # Position (center screen initially)
-        screen = QApplication.primaryScreen().geometry()
-        self.move(screen.center() - self.rect().center())
-        
-        # Orb state
-        self.current_pos = self.pos()
-        self.target_pos = self.pos()
-        self.cursor_history = []
-        self.last_cursor_pos = QCursor.pos()
-        self.velocity = 0.0
-        
-        # Cognitive state
-        self.cognitive_mode = "GUARD"
-        self.glow_intensity = 0.5
-        self.predictive_offset = QPoint(0, 0)
-        self.necessity_vector = (0.0, 0.0)
-        
-        # Color mapping for Triad C modes
-        self.mode_colors = {
-            "GUARD": QColor(0, 128, 128),        # Teal - Deductive validation
-            "GUARD-HABIT": QColor(64, 160, 128), # Teal-Green transition
-            "HABIT": QColor(255, 191, 0),        # Amber - Humean vivacity
-            "INTUITION-JUMP": QColor(143, 0, 255), # Violet - Spinozan necessity
-        }
-        self.current_color = self.mode_colors["GUARD"]
-        self.target_color = self.current_color
-        
-        # Animation properties
-        self.lerp_speed = 0.08  # Base speed
-        self.pulse_radius = 40
-        self.pulse_expansion = 0
-        
-        # Setup cognitive worker thread
-        self.worker_thread = QThread()
-        self.worker = CognitiveWorker(self.controller)
-        self.worker.moveToThread(self.worker_thread)
-        self.worker.pulse_signal.connect(self.handle_cognitive_pulse)
-        
-        # Timer for cursor tracking
-        self.track_timer = QTimer()
-        self.track_timer.timeout.connect(self.track_cursor)
-        self.track_timer.start(16)  # ~60fps
-        
-        # Timer for animation
-        self.anim_timer = QTimer()
-        self.anim_timer.timeout.connect(self.update_animation)
-        self.anim_timer.start(16)
-        
-        # Timer for cognitive processing (throttled)
-        self.cognitive_timer = QTimer()
-        self.cognitive_timer.timeout.connect(self.process_cognition)
-        self.cognitive_timer.start(100)  # 10Hz cognitive updates
-        
-        # Setup UI elements
-        self.setup_ui()
-        
-        # Start worker
-        self.worker_thread.start()
-        
-    def setup_ui(self):
-        """Setup shadow effects and HUD"""
-        # Glow effect
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(30)
-        self.shadow.setColor(self.current_color)
-        self.shadow.setOffset(0, 0)
-        self.setGraphicsEffect(self.shadow)
-        
-        # HUD Label (for debugging/mode display)
-        self.hud = QLabel(self)
-        self.hud.setGeometry(10, 10, 100, 20)
-        self.hud.setStyleSheet("color: white; background: rgba(0,0,0,0.5); border-radius: 10px; padding: 2px;")
-        self.hud.setFont(QFont("Consolas", 8))
-        self.hud.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.hud.setText("GUARD")
-        self.hud.hide()  # Hidden by default, show on hover
-        
-    def track_cursor(self):
-        """Track cursor movement and calculate velocity"""
-        current = QCursor.pos()
-        dx = current.x() - self.last_cursor_pos.x()
-        dy = current.y() - self.last_cursor_pos.y()
-        self.velocity = math.sqrt(dx*dx + dy*dy)
-        self.cursor_history.append((current, self.velocity))
-        if len(self.cursor_history) > 10:
-            self.cursor_history.pop(0)
-        self.last_cursor_pos = current
-        
-    def process_cognition(self):
-        """Emit cognitive processing to worker thread"""
-        if not self.worker_thread.isRunning():
-            return
-        # Calculate average velocity
-        vel = self.velocity if self.velocity > 0 else 0.1
-        self.worker.process_cursor(self.last_cursor_pos, vel)
-        
-    def handle_cognitive_pulse(self, pulse):
-        """Receive cognitive pulse from controller"""
-        self.cognitive_mode = pulse.get("cognitive_mode", "GUARD")
-        self.glow_intensity = pulse.get("glow_intensity", 0.5)
-        
-        # Handle predictive intent (Humean)
-        if "predictive_intent" in pulse and self.cognitive_mode in ["HABIT", "GUARD-HABIT"]:
-            pred = pulse["predictive_intent"]
-            if pred and "target" in pred:
-                # Convert quadrant prediction to offset
-                quad_offsets = {
-                    "NW": (-50, -50), "NE": (50, -50),
-                    "SW": (-50, 50), "SE": (50, 50)
-                }
-                offset = quad_offsets.get(pred["target"], (0, 0))
-                self.predictive_offset = QPoint(offset[0], offset[1])
-                # Increase lerp speed for habit (eager following)
-                self.lerp_speed = 0.15
-            else:
-                self.predictive_offset = QPoint(0, 0)
-                
-        # Handle necessity vector (Spinozan)
-        if self.cognitive_mode == "INTUITION-JUMP":
-            jump_vec = pulse.get("jump_vector", [0, 0])
-            if jump_vec:
-                screen = QApplication.primaryScreen().geometry()
-                # Map normalized vector to screen coordinates
-                target_x = screen.center().x() + jump_vec[0] * 200
-                target_y = screen.center().y() + jump_vec[1] * 200
-                self.necessity_vector = (target_x, target_y)
-                # Instant snap (Spinozan necessity - no lerp)
-                self.target_pos = QPoint(int(target_x), int(target_y)) - QPoint(60, 60)
-                self.lerp_speed = 1.0  # Instant
-        else:
-            # Normal cursor following with optional prediction
-            cursor_pos = self.last_cursor_pos
-            target = cursor_pos + self.predictive_offset - QPoint(60, 60)
-            self.target_pos = target
-            
-        # Update target color based on mode
-        self.target_color = self.mode_colors.get(self.cognitive_mode, self.mode_colors["GUARD"])
-        
-        # Update HUD
-        self.hud.setText(f"{self.cognitive_mode} | {self.glow_intensity:.2f}")
-        
-    def update_animation(self):
-        """Lerp animation and visual effects"""
-        # Color interpolation
-        r = self.current_color.red() + (self.target_color.red() - self.current_color.red()) * 0.1
-        g = self.current_color.green() + (self.target_color.green() - self.current_color.green()) * 0.1
-        b = self.current_color.blue() + (self.target_color.blue() - self.current_color.blue()) * 0.1
-        self.current_color = QColor(int(r), int(g), int(b))
-        
-        # Update shadow color
-        self.shadow.setColor(self.current_color)
-        
-        # Glow intensity affects blur radius
-        base_blur = 20
-        max_blur = 60
-        current_blur = base_blur + (max_blur - base_blur) * self.glow_intensity
-        self.shadow.setBlurRadius(int(current_blur))
-        
-        # Position lerp (except for Jump mode which snaps)
-        if self.cognitive_mode != "INTUITION-JUMP":
-            new_x = self.current_pos.x() + (self.target_pos.x() - self.current_pos.x()) * self.lerp_speed
-            new_y = self.current_pos.y() + (self.target_pos.y() - self.current_pos.y()) * self.lerp_speed
-            self.current_pos = QPoint(int(new_x), int(new_y))
-            self.move(self.current_pos)
-            
-        # Pulse effect for Intuition mode
-        if self.cognitive_mode == "INTUITION-JUMP":
-            self.pulse_expansion = (self.pulse_expansion + 2) % 20
-        else:
-            self.pulse_expansion = 0
-            
-        self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw outer pulse for Intuition mode
-        if self.cognitive_mode == "INTUITION-JUMP" and self.pulse_expansion > 0:
-            pulse_alpha = 255 - (self.pulse_expansion * 10)
-            pulse_color = QColor(self.current_color.red(), 
-                               self.current_color.green(), 
-                               self.current_color.blue(), 
-                               max(0, pulse_alpha))
-            painter.setBrush(QBrush(pulse_color))
-            painter.setPen(Qt.PenStyle.NoPen)
-            pulse_radius = 60 + self.pulse_expansion
-            painter.drawEllipse(int(60 - pulse_radius/2), int(60 - pulse_radius/2), 
-                               pulse_radius, pulse_radius)
-        
-        # Draw main orb
-        gradient = QBrush(self.current_color)
-        painter.setBrush(gradient)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(10, 10, 100, 100)
-        
-        # Inner highlight
-        painter.setBrush(QBrush(QColor(255, 255, 255, 50)))
-        painter.drawEllipse(25, 25, 70, 70)
-        
-    def enterEvent(self, event):
-        """Show HUD on hover"""
-        self.hud.show()
-        
-    def leaveEvent(self, event):
-        """Hide HUD"""
-        self.hud.hide()
-        
-    def mousePressEvent(self, event):
-        """Allow dragging"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
-            event.accept()
-            
-    def mouseMoveEvent(self, event):
-        """Drag handling"""
-        if event.buttons() == Qt.MouseButton.LeftButton:
-            self.move(event.globalPos() - self.drag_position)
-            self.current_pos = self.pos()
-            event.accept()
-            
-    def closeEvent(self, event):
-        """Cleanup threads"""
-        self.worker.running = False
-        self.worker_thread.quit()
-        self.worker_thread.wait()
-        event.accept()
-
-
-def main():
-    app = QApplication(sys.argv)
-    app.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
-    orb = FloatingOrb()
-    orb.show()
-    print("SF-ORB Interface Active")
-    print("Click and drag to move the orb")
-    print("Hover to see cognitive mode HUD")
-    print("Watch the color change:")
-    print("  Teal = Guard (Deductive validation)")
-    print("  Amber = Habit (Inductive prediction)")
-    print("  Violet = Intuition (Spinozan jump)")
-    sys.exit(app.exec())
-
-
 if __name__ == "__main__":
     main()
@@ -1,21 +1,45 @@
 #!/usr/bin/env python3
 import sys
 import json
+import time
+import tempfile
+from functools import lru_cache
+from multiprocessing.connection import Listener
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
+sys.path.insert(1, str(ROOT.parent))  # logic_seeds/, for seed_io
 
 from logic.deductive_logic import DeductiveEngine
+from seed_io import dumps
 
-def run(stimulus_input: dict = None, idle_mode: bool = False):
-    engine = DeductiveEngine(ROOT)
+# Where `--serve` listens: a UNIX socket on POSIX, a named pipe on Windows
+if sys.platform == "win32":
+    SERVICE_FAMILY = "AF_PIPE"
+    SERVICE_ADDRESS = r"\\.\pipe\sf_orb"
+else:
+    SERVICE_FAMILY = "AF_UNIX"
+    SERVICE_ADDRESS = str(Path(tempfile.gettempdir()) / "sf_orb_deductive.sock")
+
+
+def cached_advisor(engine: DeductiveEngine):
+    """Memoize engine.advise_orb on (stimulus type, canonical hlsf node)."""
+    @lru_cache(maxsize=1024)
+    def _advise(stimulus_type: str, node_items: tuple) -> dict:
+        return engine.advise_orb(stimulus_type=stimulus_type, hlsf_node_data=dict(node_items))
     
-    if idle_mode:
-        # Idle processing for recursive improvement
-        result = engine.process_idle_feedback()
-        return result
+    def advise_orb(stimulus_type: str, hlsf_node_data: dict) -> dict:
+        try:
+            return _advise(stimulus_type, tuple(sorted(hlsf_node_data.items())))
+        except TypeError:
+            # Unhashable node payload (nested lists/dicts): compute uncached
+            return engine.advise_orb(stimulus_type=stimulus_type, hlsf_node_data=hlsf_node_data)
     
+    advise_orb.cache_clear = _advise.cache_clear
+    return advise_orb
+
+def advise(engine: DeductiveEngine, stimulus_input: dict = None, advise_orb=None) -> dict:
     if stimulus_input is None:
         stimulus_input = {
             "type": "cursor_movement",
@@ -23,35 +47,85 @@ def run(stimulus_input: dict = None, idle_mode: bool = False):
             "hlsf_node": {"density": 10, "recursion": 1}
         }
     
-    advisory = engine.advise_orb(
+    advise_orb = advise_orb or engine.advise_orb
+    advisory = advise_orb(
         stimulus_type=stimulus_input.get("type", "unknown"),
         hlsf_node_data=stimulus_input.get("hlsf_node", {})
     )
     
     status = engine.get_cognitive_status()
     
-    output = {
+    return {
         "worker": "deductive_reasoner",
         "advisory": advisory,
         "cognitive_status": status,
-        "timestamp": __import__('time').time()
+        "timestamp": time.time()
     }
+
+def run(stimulus_input: dict = None, idle_mode: bool = False):
+    engine = DeductiveEngine(ROOT)
+    
+    if idle_mode:
+        # Idle processing for recursive improvement
+        result = engine.process_idle_feedback()
+        return result
     
-    print(json.dumps(output, indent=2))
+    output = advise(engine, stimulus_input)
+    print(dumps(output, indent=True))
     return output
 
 def validate(verdict_id: str, was_correct: bool):
     """External validation entry point."""
     engine = DeductiveEngine(ROOT)
     engine.validate_verdict(verdict_id, was_correct)
-    print(json.dumps({"status": "validated", "verdict_id": verdict_id}))
+    print(dumps({"status": "validated", "verdict_id": verdict_id}))
+
+def handle_request(engine: DeductiveEngine, request: dict, advise_orb=None) -> dict:
+    """Answer one service message: {"op": "run" | "idle" | "validate", ...}."""
+    op = request.get("op", "run")
+    if op == "run":
+        return advise(engine, request.get("stimulus"), advise_orb)
+    if op == "idle":
+        return engine.process_idle_feedback()
+    if op == "validate":
+        engine.validate_verdict(request["verdict_id"], bool(request["was_correct"]))
+        if advise_orb is not None:
+            advise_orb.cache_clear()  # calibration moved; cached advice is stale
+        return {"status": "validated", "verdict_id": request["verdict_id"]}
+    return {"status": "error", "error": f"unknown op: {op}"}
+
+def serve(address: str = SERVICE_ADDRESS):
+    """Keep one warm DeductiveEngine and answer JSON requests over a local socket/pipe."""
+    engine = DeductiveEngine(ROOT)
+    advise_orb = cached_advisor(engine)
+    if SERVICE_FAMILY == "AF_UNIX":
+        Path(address).unlink(missing_ok=True)  # stale socket from a previous run
+    
+    with Listener(address, family=SERVICE_FAMILY) as listener:
+        print(dumps({"status": "serving", "address": address}), flush=True)
+        while True:
+            with listener.accept() as conn:
+                while True:
+                    try:
+                        message = conn.recv_bytes()
+                    except EOFError:
+                        break
+                    try:
+                        response = handle_request(engine, json.loads(message), advise_orb)
+                    except Exception as e:
+                        response = {"status": "error", "error": str(e)}
+                    conn.send_bytes(dumps(response).encode())
 
 if __name__ == "__main__":
     args = sys.argv[1:]
     
-    if "--idle" in args:
+    if "--serve" in args:
+        # Format: --serve [address]
+        idx = args.index("--serve")
+        serve(args[idx + 1] if len(args) > idx + 1 else SERVICE_ADDRESS)
+    elif "--idle" in args:
         result = run(idle_mode=True)
-        print(json.dumps(result, indent=2))
+        print(dumps(result, indent=True))
     elif "--validate" in args:
         # Format: --validate <verdict_id> <true/false>
         idx = args.index("--validate")
@@ -66,4 +140,4 @@ if __name__ == "__main__":
         else:
             input_data = None
         
-        run(input_data)
\ No newline at end of file
+        run(input_data)
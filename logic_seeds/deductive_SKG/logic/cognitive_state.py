@@ -1,13 +1,49 @@
 """Cognitive state with tracelogging and apriori truth management."""
-import json
+import atexit
 import time
 import hashlib
+import re
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
-from dataclasses import dataclass, asdict, field
-from collections import deque
+from typing import List, Dict, Optional, Set, Tuple, Any
+from dataclasses import dataclass, field
+from collections import deque, OrderedDict
+import numpy as np
 
-@dataclass
+from seed_io import canonical as _canonical, dumps as _dumps, loads as _loads, write_atomic as _write_atomic
+
+def _to_dict(record) -> dict:
+    """Flat field dict of a slotted record; a shallow stand-in for dataclasses.asdict."""
+    return {k: getattr(record, k) for k in record.__slots__}
+
+# Tracelog lines are written through a buffered handle and flushed in batches
+TRACE_FLUSH_EVERY = 32       # verdicts
+TRACE_FLUSH_INTERVAL = 1.0   # seconds since the last flush
+APRIORI_FLUSH_INTERVAL = 1.0 # min seconds between apriori rewrites during promotion bursts
+CONTEXT_HASH_CACHE = 128     # recent context hashes kept by record_verdict
+PRETTY_STATE = False         # indent state/apriori JSON (debugging only; compact is ~2x smaller)
+
+_TOKEN = re.compile(r"\w+")
+
+def _rule_tokens(category: str, rule: Any) -> Set[str]:
+    """Word tokens a premise can share with a category: its name and the rule's string values."""
+    tokens = set(_TOKEN.findall(category))
+    stack = [rule]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            tokens.update(_TOKEN.findall(item))
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return tokens
+
+def _ethics(valid: bool, certainty: float, chain_consistency: bool) -> float:
+    """Ethics alignment kernel on plain scalars (see DeductiveCognition._calculate_ethics_alignment)."""
+    score = (0.4 if valid else 0.0) + certainty * 0.3 + (0.3 if chain_consistency else 0.0)
+    return score if score < 1.0 else 1.0
+
+@dataclass(slots=True)
 class VerdictTrace:
     verdict_id: str
     timestamp: float
@@ -20,7 +56,7 @@ class VerdictTrace:
     validation_timestamp: Optional[float] = None
     context_hash: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class Syllogism:
     major_premise: str
     minor_premise: str  
@@ -30,7 +66,7 @@ class Syllogism:
     timestamp: float
     ethics_validated: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class AprioriTruth:
     statement: str
     certainty: float
@@ -39,6 +75,96 @@ class AprioriTruth:
     last_confirmed: float
     ethical_implications: Dict[str, float]
 
+class TraceLog:
+    """Fixed-capacity ring of verdict traces stored as parallel columns.
+    
+    The scalar fields scanned by idle analysis live in NumPy arrays, the short
+    strings in parallel lists. Iteration and ``get`` build VerdictTrace views.
+    """
+    
+    def __init__(self, maxlen: int = 1000):
+        self.maxlen = maxlen
+        self.timestamp = np.zeros(maxlen, dtype=np.float64)
+        self.confidence = np.zeros(maxlen, dtype=np.float64)
+        self.ethics = np.zeros(maxlen, dtype=np.float64)
+        self.validation_timestamp = np.full(maxlen, np.nan)
+        self.was_used = np.zeros(maxlen, dtype=bool)
+        self.was_correct = np.full(maxlen, -1, dtype=np.int8)  # -1 unvalidated, 0, 1
+        self.type_id = np.zeros(maxlen, dtype=np.int16)
+        self.verdict_id: List[Optional[str]] = [None] * maxlen
+        self.conclusion: List[str] = [""] * maxlen
+        self.context_hash: List[str] = [""] * maxlen
+        self.types: List[str] = []  # interned verdict types, indexed by type_id
+        self._type_ids: Dict[str, int] = {}
+        self.head = 0  # next slot to write
+        self.size = 0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __iter__(self):
+        for slot in self.order().tolist():
+            yield self.get(slot)
+    
+    def used(self):
+        """VerdictTrace views of the used traces only, oldest first."""
+        order = self.order()
+        for slot in order[self.was_used[order]].tolist():
+            yield self.get(slot)
+    
+    def order(self) -> np.ndarray:
+        """Slots from oldest to newest."""
+        if self.size < self.maxlen:
+            return np.arange(self.size)
+        return (np.arange(self.maxlen) + self.head) % self.maxlen
+    
+    def append(self, trace: VerdictTrace) -> Tuple[int, Optional[str]]:
+        """Store a trace; returns its slot and the verdict_id it overwrote, if any."""
+        slot = self.head
+        evicted = self.verdict_id[slot] if self.size == self.maxlen else None
+        type_id = self._type_ids.get(trace.verdict_type)
+        if type_id is None:
+            type_id = self._type_ids[trace.verdict_type] = len(self.types)
+            self.types.append(trace.verdict_type)
+        self.timestamp[slot] = trace.timestamp
+        self.confidence[slot] = trace.confidence
+        self.ethics[slot] = trace.ethics_alignment_score
+        self.was_used[slot] = trace.was_used
+        self.was_correct[slot] = -1 if trace.was_correct is None else int(trace.was_correct)
+        self.validation_timestamp[slot] = (
+            np.nan if trace.validation_timestamp is None else trace.validation_timestamp
+        )
+        self.type_id[slot] = type_id
+        self.verdict_id[slot] = trace.verdict_id
+        self.conclusion[slot] = trace.conclusion
+        self.context_hash[slot] = trace.context_hash
+        self.head = (slot + 1) % self.maxlen
+        if self.size < self.maxlen:
+            self.size += 1
+        return slot, evicted
+    
+    def mark(self, slot: int, was_correct: bool, timestamp: float):
+        self.was_used[slot] = True
+        self.was_correct[slot] = int(was_correct)
+        self.validation_timestamp[slot] = timestamp
+    
+    def get(self, slot: int) -> VerdictTrace:
+        """VerdictTrace view of one slot (a copy; write back through ``mark``)."""
+        correct = int(self.was_correct[slot])
+        validated_at = float(self.validation_timestamp[slot])
+        return VerdictTrace(
+            verdict_id=self.verdict_id[slot],
+            timestamp=float(self.timestamp[slot]),
+            verdict_type=self.types[self.type_id[slot]],
+            conclusion=self.conclusion[slot],
+            confidence=float(self.confidence[slot]),
+            ethics_alignment_score=float(self.ethics[slot]),
+            was_used=bool(self.was_used[slot]),
+            was_correct=None if correct < 0 else bool(correct),
+            validation_timestamp=None if validated_at != validated_at else validated_at,
+            context_hash=self.context_hash[slot]
+        )
+
 class DeductiveCognition:
     def __init__(self, vault_path: Path):
         self.vault_path = vault_path
@@ -52,9 +178,17 @@ class DeductiveCognition:
         
         # State containers
         self.syllogism_chain: List[Syllogism] = []
+        self._validity_n = 0  # syllogisms counted into _valid_count
+        self._valid_count = 0  # running count of valid syllogisms
         self.premise_base: Dict[str, Dict] = {}
-        self.verdict_tracelog: deque = deque(maxlen=1000)  # Circular buffer for recent traces
+        self._premise_token_index: Dict[str, Set[str]] = {}  # rule token -> categories
+        self.verdict_tracelog = TraceLog(maxlen=1000)  # Circular buffer for recent traces
+        self._trace_by_id: Dict[str, int] = {}  # verdict_id -> slot in the buffer
         self.apriori_truths: Dict[str, AprioriTruth] = {}
+        self._apriori_by_type: Dict[str, List[AprioriTruth]] = {}  # verdict_type -> truths
+        self._apriori_dirty = False  # promoted/strengthened since the last save_apriori
+        self._last_apriori_save = 0.0
+        self._ctx_cache: "OrderedDict[tuple, str]" = OrderedDict()  # context items -> context_hash
         
         # Calibration data
         self.confidence_calibration = {
@@ -64,73 +198,122 @@ class DeductiveCognition:
         }
         
         self._load_all()
+        self._sync_validity_count()
+        
+        # Long-lived append handle for the tracelog; see save_tracelog
+        self._trace_fh = open(self.trace_path / "verdict_log.jsonl", 'a', buffering=1 << 16)
+        self._pending_traces: List[int] = []  # slots recorded but not yet written
+        self._last_trace_flush = time.time()
+        self._syllogism_fh = open(self.vault_path / "syllogism_chain.jsonl", 'a', buffering=1)
+        atexit.register(self.close)
     
     def _load_all(self):
-        """Load apriori truths and recent tracelog."""
+        """Load apriori truths and recent tracelog.
+        
+        Files are read as bytes and handed straight to the parser, skipping a
+        per-line UTF-8 decode into str that orjson would only re-scan.
+        """
         # Load apriori truths
         apriori_file = self.apriori_path / "absolute_truths.json"
         if apriori_file.exists():
-            with open(apriori_file, 'r') as f:
-                data = json.load(f)
+            with open(apriori_file, 'rb') as f:
+                data = _loads(f.read())
                 self.apriori_truths = {
                     k: AprioriTruth(**v) for k, v in data.items()
                 }
+                for key, truth in self.apriori_truths.items():
+                    self._apriori_by_type.setdefault(key.partition(":")[0], []).append(truth)
         
         # Load tracelog (last 1000)
         trace_file = self.trace_path / "verdict_log.jsonl"
         if trace_file.exists():
-            with open(trace_file, 'r') as f:
-                lines = f.readlines()[-1000:]
-                for line in lines:
+            with open(trace_file, 'rb') as f:
+                # Bounded tail: only the last maxlen lines are ever held in memory
+                for line in deque(f, maxlen=self.verdict_tracelog.maxlen):
                     try:
-                        data = json.loads(line)
-                        self.verdict_tracelog.append(VerdictTrace(**data))
+                        data = _loads(line)
+                        self._append_trace(VerdictTrace(**data))
                     except:
                         continue
         
         # Load calibration
         cal_file = self.vault_path / "calibration.json"
         if cal_file.exists():
-            with open(cal_file, 'r') as f:
-                self.confidence_calibration = json.load(f)
+            with open(cal_file, 'rb') as f:
+                self.confidence_calibration = _loads(f.read())
         
         # Load premises
         state_file = self.vault_path / "deductive_state.json"
+        legacy_chain = []
         if state_file.exists():
-            with open(state_file, 'r') as f:
-                data = json.load(f)
+            with open(state_file, 'rb') as f:
+                data = _loads(f.read())
                 self.premise_base = data.get("premises", {})
-                self.syllogism_chain = [
-                    Syllogism(**s) for s in data.get("chain", [])
-                ]
+                for cat, entry in self.premise_base.items():
+                    self._index_premise(cat, entry.get("rule", {}))
+                legacy_chain = data.get("chain", [])
+        
+        # Load syllogism chain (append-only)
+        chain_file = self.vault_path / "syllogism_chain.jsonl"
+        if chain_file.exists():
+            with open(chain_file, 'rb') as f:
+                for line in f:
+                    try:
+                        self.syllogism_chain.append(Syllogism(**_loads(line)))
+                    except:
+                        continue
+        elif legacy_chain:
+            # Older vaults kept the chain inside deductive_state.json
+            self.syllogism_chain = [Syllogism(**s) for s in legacy_chain]
+            with open(chain_file, 'w') as f:
+                for s in self.syllogism_chain:
+                    f.write(_dumps(_to_dict(s)) + '\n')
 
     def save_apriori(self):
         """Save absolute truths separately."""
-        apriori_file = self.apriori_path / "absolute_truths.json"
-        with open(apriori_file, 'w') as f:
-            json.dump({k: asdict(v) for k, v in self.apriori_truths.items()}, f, indent=2)
+        self._apriori_dirty = False
+        self._last_apriori_save = time.time()
+        _write_atomic(
+            self.apriori_path / "absolute_truths.json",
+            _dumps({k: _to_dict(v) for k, v in self.apriori_truths.items()}, indent=PRETTY_STATE)
+        )
     
     def save_tracelog(self):
-        """Append-only tracelog for recursive processing."""
-        trace_file = self.trace_path / "verdict_log.jsonl"
-        # Save only new entries
-        with open(trace_file, 'a') as f:
-            for trace in self.verdict_tracelog:
-                if not hasattr(trace, '_written'):
-                    f.write(json.dumps(asdict(trace)) + '\n')
-                    trace._written = True
+        """Write pending traces to the append-only tracelog and flush."""
+        if self._pending_traces:
+            log = self.verdict_tracelog
+            self._trace_fh.writelines(
+                _dumps(_to_dict(log.get(slot))) + '\n' for slot in self._pending_traces
+            )
+            self._trace_fh.flush()
+            self._pending_traces.clear()
+        self._last_trace_flush = time.time()
+    
+    def _append_tracelog(self, slot: int):
+        """Queue one trace; write every TRACE_FLUSH_EVERY traces or TRACE_FLUSH_INTERVAL seconds."""
+        self._pending_traces.append(slot)
+        if (len(self._pending_traces) >= TRACE_FLUSH_EVERY
+                or time.time() - self._last_trace_flush >= TRACE_FLUSH_INTERVAL):
+            self.save_tracelog()
+    
+    def close(self):
+        """Flush and release the tracelog and syllogism chain handles."""
+        if not self._trace_fh.closed:
+            self.save_tracelog()
+            self._trace_fh.close()
+        self._syllogism_fh.close()
+        if self._apriori_dirty:
+            self.save_apriori()
     
     def save_state(self):
-        """Save mutable state."""
-        state_file = self.vault_path / "deductive_state.json"
-        with open(state_file, 'w') as f:
-            json.dump({
-                "premises": self.premise_base,
-                "chain": [asdict(s) for s in self.syllogism_chain],
-                "calibration": self.confidence_calibration,
-                "last_updated": time.time()
-            }, f, indent=2)
-        self.save_apriori()
+        """Save premises and calibration; the syllogism chain is appended as it grows."""
+        _write_atomic(self.vault_path / "deductive_state.json", _dumps({
+            "premises": self.premise_base,
+            "calibration": self.confidence_calibration,
+            "last_updated": time.time()
+        }, indent=PRETTY_STATE))
+        if self._apriori_dirty:
+            self.save_apriori()
     
     def record_verdict(self, verdict_data: Dict, context: Dict) -> str:
         """
@@ -138,8 +321,8 @@ class DeductiveCognition:
         Returns verdict_id for tracking.
         """
         # Generate deterministic ID from content
-        content_str = json.dumps(verdict_data, sort_keys=True)
-        verdict_id = hashlib.sha256(f"{content_str}{time.time()}".encode()).hexdigest()[:16]
+        content = _canonical(verdict_data)
+        verdict_id = hashlib.blake2b(content + str(time.time()).encode(), digest_size=8).hexdigest()
         
         # Calculate ethics alignment (deterministic based on validity and certainty)
         ethics_score = self._calculate_ethics_alignment(verdict_data)
@@ -152,31 +335,53 @@ class DeductiveCognition:
             confidence=verdict_data.get("certainty", 0.0),
             ethics_alignment_score=ethics_score,
             was_used=False,
-            context_hash=hashlib.sha256(json.dumps(context, sort_keys=True).encode()).hexdigest()[:8]
+            context_hash=self._context_hash(context)
         )
         
-        self.verdict_tracelog.append(trace)
+        slot = self._append_trace(trace)
         self.confidence_calibration["total_verdicts"] += 1
-        self.save_tracelog()
+        self._append_tracelog(slot)
         
         return verdict_id
     
+    def _append_trace(self, trace: VerdictTrace) -> int:
+        """Append to the circular tracelog, keeping the verdict_id index in step."""
+        slot, evicted = self.verdict_tracelog.append(trace)
+        if evicted is not None and self._trace_by_id.get(evicted) == slot:
+            del self._trace_by_id[evicted]
+        self._trace_by_id[trace.verdict_id] = slot
+        return slot
+    
+    def _context_hash(self, context: Dict) -> str:
+        """Hash a verdict context, reusing the result for recently seen contexts."""
+        try:
+            # Typed key so 1, 1.0 and True (equal, but serialized differently) stay apart
+            key = tuple(sorted((k, type(v), v) for k, v in context.items()))
+            cached = self._ctx_cache.get(key)
+        except TypeError:
+            # Unhashable or unorderable values: hash without caching
+            return hashlib.blake2b(_canonical(context), digest_size=4).hexdigest()
+        if cached is None:
+            cached = hashlib.blake2b(_canonical(context), digest_size=4).hexdigest()
+            if len(self._ctx_cache) >= CONTEXT_HASH_CACHE:
+                self._ctx_cache.popitem(last=False)
+            self._ctx_cache[key] = cached
+        return cached
+    
     def mark_verdict_used(self, verdict_id: str, was_correct: bool):
         """Called by ORB/validator when verdict is used and validated."""
-        for trace in self.verdict_tracelog:
-            if trace.verdict_id == verdict_id:
-                trace.was_used = True
-                trace.was_correct = was_correct
-                trace.validation_timestamp = time.time()
-                
-                if was_correct:
-                    self.confidence_calibration["correct_verdicts"] += 1
-                    # Promote to apriori if consistently correct
-                    self._consider_apriori_promotion(trace)
-                
-                self._update_calibration()
-                self.save_tracelog()
-                break
+        slot = self._trace_by_id.get(verdict_id)
+        if slot is None:
+            return
+        self.verdict_tracelog.mark(slot, was_correct, time.time())
+        trace = self.verdict_tracelog.get(slot)
+        
+        if was_correct:
+            self.confidence_calibration["correct_verdicts"] += 1
+            # Promote to apriori if consistently correct
+            self._consider_apriori_promotion(trace)
+        
+        self._update_calibration()
     
     def _consider_apriori_promotion(self, trace: VerdictTrace):
         """Move highly validated truths to apriori storage."""
@@ -191,7 +396,7 @@ class DeductiveCognition:
                 truth.certainty = min(0.999, truth.certainty + 0.001)
             else:
                 # New absolute truth
-                self.apriori_truths[truth_key] = AprioriTruth(
+                truth = AprioriTruth(
                     statement=trace.conclusion,
                     certainty=trace.confidence,
                     validation_count=1,
@@ -199,8 +404,13 @@ class DeductiveCognition:
                     last_confirmed=time.time(),
                     ethical_implications={"validity": trace.ethics_alignment_score}
                 )
+                self.apriori_truths[truth_key] = truth
+                self._apriori_by_type.setdefault(trace.verdict_type, []).append(truth)
             
-            self.save_apriori()
+            # Coalesce bursts: rewrite at most once per interval; save_state/close flush the rest
+            self._apriori_dirty = True
+            if time.time() - self._last_apriori_save >= APRIORI_FLUSH_INTERVAL:
+                self.save_apriori()
     
     def _calculate_ethics_alignment(self, verdict_data: Dict) -> float:
         """
@@ -209,14 +419,11 @@ class DeductiveCognition:
         - High certainty: +0.3
         - Consistent with premises: +0.3
         """
-        score = 0.0
-        if verdict_data.get("valid"):
-            score += 0.4
-        certainty = verdict_data.get("certainty", 0)
-        score += certainty * 0.3
-        if verdict_data.get("chain_consistency"):
-            score += 0.3
-        return min(score, 1.0)
+        return _ethics(
+            bool(verdict_data.get("valid")),
+            verdict_data.get("certainty", 0),
+            bool(verdict_data.get("chain_consistency"))
+        )
     
     def _update_calibration(self):
         """Update confidence accuracy metrics."""
@@ -236,21 +443,20 @@ class DeductiveCognition:
         improvements = []
         
         # Pattern analysis: which premise types lead to correct verdicts?
-        premise_success = {}
-        for trace in self.verdict_tracelog:
-            if trace.was_correct is not None:
-                # Extract premise context from tracelog (simplified)
-                key = trace.verdict_type
-                if key not in premise_success:
-                    premise_success[key] = {"correct": 0, "total": 0}
-                premise_success[key]["total"] += 1
-                if trace.was_correct:
-                    premise_success[key]["correct"] += 1
+        log = self.verdict_tracelog
+        order = log.order()
+        correct = log.was_correct[order]
+        validated = correct >= 0
+        ids, first, inv = np.unique(log.type_id[order][validated], return_index=True, return_inverse=True)
+        names = [log.types[i] for i in ids.tolist()]
+        totals = np.bincount(inv, minlength=len(names))
+        corrects = np.bincount(inv, weights=correct[validated], minlength=len(names))
         
-        # Adjust premise weights based on historical accuracy
-        for premise_type, stats in premise_success.items():
-            if stats["total"] > 5:
-                accuracy = stats["correct"] / stats["total"]
+        # Adjust premise weights based on historical accuracy (in order of first appearance)
+        for i in np.argsort(first, kind="stable"):
+            premise_type = names[i]
+            if totals[i] > 5:
+                accuracy = float(corrects[i] / totals[i])
                 if accuracy < 0.5 and premise_type in self.premise_base:
                     # Reduce weight of unreliable premises
                     self.premise_base[premise_type]["reliability"] = accuracy
@@ -258,6 +464,7 @@ class DeductiveCognition:
         
         # Update calibration
         self._update_calibration()
+        self.save_tracelog()
         self.save_state()
         
         return {
@@ -269,12 +476,25 @@ class DeductiveCognition:
     
     def query_apriori(self, query_type: str) -> List[AprioriTruth]:
         """Provide CALI with absolute truths for discernment."""
+        by_type = self._apriori_by_type.get(query_type)
+        if by_type is not None:
+            return [truth for truth in by_type if truth.certainty > 0.9]
+        # Not a verdict type: partial match against the "type:conclusion" keys
         return [
             truth for key, truth in self.apriori_truths.items()
             if query_type in key and truth.certainty > 0.9
         ]
     
+    def _index_premise(self, category: str, rule: Dict):
+        """Register the category under each of its rule tokens."""
+        for token in _rule_tokens(category, rule):
+            self._premise_token_index.setdefault(token, set()).add(category)
+    
     def add_premise(self, category: str, rule: Dict):
+        if category in self.premise_base:
+            for token in _rule_tokens(category, self.premise_base[category].get("rule", {})):
+                self._premise_token_index[token].discard(category)
+        self._index_premise(category, rule)
         self.premise_base[category] = {
             "rule": rule,
             "added": time.time(),
@@ -295,11 +515,24 @@ class DeductiveCognition:
             ethics_validated=(certainty > 0.9 and valid)
         )
         self.syllogism_chain.append(syllogism)
-        for premise in [major, minor]:
-            for cat, data in self.premise_base.items():
-                if premise in str(data.get("rule", {})):
-                    data["uses"] += 1
-        self.save_state()
+        self._sync_validity_count()
+        index = self._premise_token_index
+        for premise in (major, minor):
+            matched = set()
+            for token in _TOKEN.findall(premise):
+                matched.update(index.get(token, ()))
+            for cat in matched:
+                self.premise_base[cat]["uses"] += 1
+        # One line per syllogism; premise use counts persist with the next save_state
+        self._syllogism_fh.write(_dumps(_to_dict(syllogism)) + '\n')
+    
+    def _sync_validity_count(self):
+        """Count newly appended syllogisms into the running validity total."""
+        n = len(self.syllogism_chain)
+        for i in range(self._validity_n, n):
+            if self.syllogism_chain[i].validity:
+                self._valid_count += 1
+        self._validity_n = n
     
     def get_premise(self, category: str) -> Optional[Dict]:
         return self.premise_base.get(category)
@@ -310,8 +543,7 @@ class DeductiveCognition:
     def calculate_validity_score(self) -> float:
         if not self.syllogism_chain:
             return 0.0
-        valid_count = sum(1 for s in self.syllogism_chain if s.validity)
-        return valid_count / len(self.syllogism_chain)
+        return self._valid_count / self._validity_n
     
     def get_calibration_report(self) -> Dict:
         """Export calibration data for CALI."""
@@ -147,6 +147,6 @@ class DeductiveEngine:
                 "ethics_score": t.ethics_alignment_score,
                 "verdict_type": t.verdict_type
             }
-            for t in self.cognition.verdict_tracelog 
-            if t.was_used  # Only exported used verdicts for pattern analysis
+            # Only exported used verdicts for pattern analysis
+            for t in self.cognition.verdict_tracelog.used()
         ]
\ No newline at end of file
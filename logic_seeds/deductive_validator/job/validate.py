@@ -6,6 +6,7 @@ from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
+sys.path.insert(1, str(ROOT.parent))  # logic_seeds/, for seed_io
 
 from logic.deductive_validation import DeductiveValidator
 
@@ -9,6 +9,7 @@ Core logic MUST ONLY emit verdicts TO this layer for witnessing.
 
 Any changes to this interface require full system validation.
 """
+import re
 import time
 from pathlib import Path
 from typing import Dict, List, Tuple
@@ -27,6 +28,28 @@ class DeductiveValidator:
                 "certainty": 1.0
             }
         }
+        
+        # Verdict type -> reference premise and which of its attributes confirm a conclusion
+        self.type_checks = {
+            "cursor_movement": {
+                "premise": "spatial_movement",
+                "confirms": ["implies_navigation"],
+                "note": "cursor_movement → navigation"
+            }
+        }
+        # One precompiled alternation per verdict type, matched in a single pass
+        self._conclusion_matchers = {
+            v_type: re.compile("|".join(re.escape(token) for token in self._confirming_attributes(check)))
+            for v_type, check in self.type_checks.items()
+        }
+    
+    def _confirming_attributes(self, check: Dict) -> List[str]:
+        """Resolve a type check's confirming tokens against its reference premise."""
+        attributes = self.reference_premises[check["premise"]]["attributes"]
+        unknown = [token for token in check["confirms"] if token not in attributes]
+        if unknown:
+            raise ValueError(f"{check['premise']} has no attributes {unknown}")
+        return [token for token in attributes if token in check["confirms"]]
     
     def validate_verdict(self, verdict_package: Dict) -> Dict:
         """
@@ -65,12 +88,10 @@ class DeductiveValidator:
         chain = []
         
         # Check against reference premises
-        if v_type == "cursor_movement":
-            premise = self.reference_premises.get("spatial_movement", {})
-            attrs = premise.get("attributes", [])
-            
-            if "implies_navigation" in conclusion:
-                chain.append("Checked: cursor_movement → navigation (premise verified)")
+        matcher = self._conclusion_matchers.get(v_type)
+        if matcher is not None:
+            if matcher.search(str(conclusion)):
+                chain.append(f"Checked: {self.type_checks[v_type]['note']} (premise verified)")
                 calc_conf = 1.0
                 status = "confirmed"
             else:
@@ -1,13 +1,21 @@
 """Immutable observation records of validation checks."""
-import json
+import atexit
 import time
 import hashlib
 from pathlib import Path
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
-from collections import deque
+from collections import deque, OrderedDict
 
-@dataclass
+from seed_io import BackgroundWriter as _BackgroundWriter, canonical as _canonical, dumpb as _dumpb, loads as _loads, tail_lines as _tail_lines
+
+def _to_dict(record) -> dict:
+    """Flat field dict of a slotted record; a shallow stand-in for dataclasses.asdict."""
+    return {k: getattr(record, k) for k in record.__slots__}
+
+VERDICT_HASH_CACHE = 128  # recent verdict hashes kept by record_observation
+
+@dataclass(slots=True)
 class ValidationObservation:
     observation_id: str
     timestamp: float
@@ -27,24 +35,35 @@ class ValidationCognition:
         # Observation log - immutable append-only
         self.observation_log: deque = deque(maxlen=5000)
         self.congruence_patterns: Dict[str, int] = {}
+        self._hash_cache: "OrderedDict[tuple, str]" = OrderedDict()  # verdict items -> hash
+        
+        # Running totals over observation_log, kept in step on append/evict
+        self._congruent_count = 0
+        self._discrepant_count = 0
+        self._delta_sum = 0.0
+        self._evictions = 0  # since the last exact recount
         
         self._load_log()
+        
+        # Log lines are written by a single background thread, off the request path
+        self._log_fh = open(self.vault_path / "observation_log.jsonl", 'ab', buffering=1 << 16)
+        self._writer = _BackgroundWriter(self._log_fh, maxsize=0)
+        atexit.register(self.close)
     
     def _load_log(self):
         log_file = self.vault_path / "observation_log.jsonl"
         if log_file.exists():
-            with open(log_file, 'r') as f:
-                for line in list(f)[-5000:]:
+            with open(log_file, 'rb') as f:
+                for line in _tail_lines(f, self.observation_log.maxlen):
                     try:
-                        data = json.loads(line)
-                        self.observation_log.append(ValidationObservation(**data))
+                        data = _loads(line)
+                        self._append_observation(ValidationObservation(**data))
                     except:
                         continue
     
     def record_observation(self, original_verdict: Dict, check_result: Dict) -> str:
         """Document the validation check without modifying verdict."""
-        content = json.dumps(original_verdict, sort_keys=True)
-        v_hash = hashlib.sha256(content.encode()).hexdigest()[:12]
+        v_hash = self._verdict_hash(original_verdict)
         
         # Determine alignment
         orig_conf = original_verdict.get("confidence", 0)
@@ -71,28 +90,77 @@ class ValidationCognition:
             notes=check_result.get("reasoning_chain", [])
         )
         
-        self.observation_log.append(obs)
+        self._append_observation(obs)
         
-        # Append to immutable log
-        with open(self.vault_path / "observation_log.jsonl", 'a') as f:
-            f.write(json.dumps(asdict(obs)) + '\n')
+        # Append to immutable log (queued for the writer thread)
+        self._writer.submit(_dumpb(_to_dict(obs)) + b'\n')
         
         return obs.observation_id
     
+    def close(self):
+        """Write out queued observations and stop the writer thread."""
+        if not self._log_fh.closed:
+            self._writer.close()
+            self._log_fh.close()
+    
+    def _append_observation(self, obs: ValidationObservation):
+        """Append to the bounded log, updating the running stats for the evicted entry too."""
+        log = self.observation_log
+        if len(log) == log.maxlen:
+            self._count_observation(log[0], -1)
+            self._evictions += 1
+        log.append(obs)
+        self._count_observation(obs, 1)
+        if self._evictions >= log.maxlen:
+            self._recount()
+    
+    def _recount(self):
+        """Rebuild the running stats in one fused pass (bounds float drift in _delta_sum)."""
+        congruent = discrepant = 0
+        delta_sum = 0.0
+        for o in self.observation_log:
+            status = o.alignment_status
+            congruent += status == "congruent"
+            discrepant += status == "discrepant"
+            delta_sum += o.confidence_delta
+        self._congruent_count, self._discrepant_count, self._delta_sum = congruent, discrepant, delta_sum
+        self._evictions = 0
+    
+    def _count_observation(self, obs: ValidationObservation, sign: int):
+        status = obs.alignment_status
+        if status == "congruent":
+            self._congruent_count += sign
+        elif status == "discrepant":
+            self._discrepant_count += sign
+        self._delta_sum += sign * obs.confidence_delta
+    
+    def _verdict_hash(self, verdict: Dict) -> str:
+        """Hash a verdict, reusing the result for recently seen flat verdicts."""
+        try:
+            # Typed key so 1, 1.0 and True (equal, but serialized differently) stay apart
+            key = tuple(sorted((k, type(v), v) for k, v in verdict.items()))
+            cached = self._hash_cache.get(key)
+        except TypeError:
+            # Nested or unorderable values: hash without caching
+            return hashlib.blake2b(_canonical(verdict), digest_size=6).hexdigest()
+        if cached is None:
+            cached = hashlib.blake2b(_canonical(verdict), digest_size=6).hexdigest()
+            if len(self._hash_cache) >= VERDICT_HASH_CACHE:
+                self._hash_cache.popitem(last=False)
+            self._hash_cache[key] = cached
+        return cached
+    
     def get_validation_stats(self) -> Dict:
         """Stats for CALI analysis."""
         total = len(self.observation_log)
         if total == 0:
             return {"total_checks": 0}
         
-        congruent = sum(1 for o in self.observation_log if o.alignment_status == "congruent")
-        discrepant = sum(1 for o in self.observation_log if o.alignment_status == "discrepant")
-        
         return {
             "total_checks": total,
-            "congruent_ratio": congruent / total,
-            "discrepant_ratio": discrepant / total,
-            "avg_confidence_delta": sum(o.confidence_delta for o in self.observation_log) / total,
+            "congruent_ratio": self._congruent_count / total,
+            "discrepant_ratio": self._discrepant_count / total,
+            "avg_confidence_delta": self._delta_sum / total,
             "common_patterns": sorted(self.congruence_patterns.items(), 
                                     key=lambda x: x[1], reverse=True)[:5]
         }
@@ -1,10 +1,25 @@
-import json
+import atexit
+import itertools
 import time
-import hashlib
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
 from collections import deque
+import numpy as np
+
+from seed_io import BackgroundWriter as _BackgroundWriter, THREADED_LOGS, dumps as _dumps, dumpb as _dumpb, loads as _loads, tail_lines as _tail_lines
+
+TRACE_FLUSH_EVERY = 64       # records
+TRACE_FLUSH_INTERVAL = 1.0   # seconds since the last flush
+APRIORI_SNAPSHOT_EVERY = 32  # delta lines before validated_patterns.json is rewritten
+
+def _scan_promotions(ratios: np.ndarray, total: np.ndarray, out_mask: np.ndarray,
+                     min_total: int, min_ratio: float) -> np.ndarray:
+    """Flag patterns with more than min_total checks and accuracy above min_ratio, into out_mask."""
+    np.greater(total, min_total, out=out_mask)
+    out_mask &= ratios > min_ratio
+    return out_mask
+
 
 @dataclass
 class VerdictTrace:
@@ -18,6 +33,30 @@ class VerdictTrace:
     vivacity_at_time: float = 0.0
     validation_time: Optional[float] = None
 
+    def to_dict(self) -> Dict:
+        return {
+            "verdict_id": self.verdict_id,
+            "timestamp": self.timestamp,
+            "pattern_predicted": self.pattern_predicted,
+            "confidence": self.confidence,
+            "actual_outcome": self.actual_outcome,
+            "was_correct": self.was_correct,
+            "ethics_alignment": self.ethics_alignment,
+            "vivacity_at_time": self.vivacity_at_time,
+            "validation_time": self.validation_time
+        }
+    
+    @classmethod
+    def from_dict_fast(cls, data: Dict) -> "VerdictTrace":
+        """Restore a loaded record without running __init__ when it has exactly the dataclass fields."""
+        if data.keys() != _TRACE_FIELDS:
+            return cls(**data)
+        obj = object.__new__(cls)
+        obj.__dict__ = data
+        return obj
+
+_TRACE_FIELDS = frozenset(f.name for f in fields(VerdictTrace))
+
 @dataclass
 class AprioriPattern:
     pattern_key: str
@@ -27,7 +66,30 @@ class AprioriPattern:
     validated_count: int
     first_seen: float
 
+    def to_dict(self) -> Dict:
+        return {
+            "pattern_key": self.pattern_key,
+            "frequency": self.frequency,
+            "predictive_accuracy": self.predictive_accuracy,
+            "ethics_score": self.ethics_score,
+            "validated_count": self.validated_count,
+            "first_seen": self.first_seen
+        }
+    
+    @classmethod
+    def from_dict_fast(cls, data: Dict) -> "AprioriPattern":
+        """Restore a loaded record without running __init__ when it has exactly the dataclass fields."""
+        if data.keys() != _APRIORI_FIELDS:
+            return cls(**data)
+        obj = object.__new__(cls)
+        obj.__dict__ = data
+        return obj
+
+_APRIORI_FIELDS = frozenset(f.name for f in fields(AprioriPattern))
+
 class InductiveCognition:
+    _verdict_counter = itertools.count()  # shared so ids stay unique across instances
+    
     def __init__(self, vault_path: Path):
         self.vault_path = vault_path
         self.vault_path.mkdir(parents=True, exist_ok=True)
@@ -43,105 +105,231 @@ class InductiveCognition:
         self.trace_path.mkdir(exist_ok=True)
         
         self.verdict_tracelog: deque = deque(maxlen=1000)
+        self._trace_by_id: Dict[str, VerdictTrace] = {}  # verdict_id -> trace still in the deque
+        # Running counts over the tracelog for the overconfidence check in idle
+        self._n_high_conf = 0        # traces with confidence > 0.5
+        self._correct_high_conf = 0  # ...of which was_correct
         self.apriori_patterns: Dict[str, AprioriPattern] = {}
         
         # Accuracy tracking per pattern type
-        self.pattern_accuracy: Dict[str, Dict] = {}
+        self.pattern_accuracy: Dict[str, List[int]] = {}  # pattern -> [correct, total]
+        # Column mirror of pattern_accuracy (same key order) for the idle-pass ratios
+        self._pa_keys: List[str] = []
+        self._pa_index: Dict[str, int] = {}
+        self._pa_correct = np.zeros(64, dtype=np.int64)
+        self._pa_total = np.zeros(64, dtype=np.int64)
+        self._pa_mask = np.zeros(64, dtype=bool)  # scratch for _scan_promotions
+        self._plen_cache: Dict[str, int] = {}  # pattern -> number of "→"-separated steps
         
         self._load_all()
+        
+        # Long-lived append handle for the tracelog; see flush
+        self._trace_fh = open(self.trace_path / "verdict_log.jsonl", 'ab', buffering=1 << 16)
+        self._trace_buf: List[bytes] = []
+        self._writer = _BackgroundWriter(self._trace_fh) if THREADED_LOGS else None
+        self._last_trace_flush = time.time()
+        self._apriori_fh = open(self.apriori_path / "apriori_delta.jsonl", 'a', buffering=1)
+        self._apriori_deltas = 0  # delta lines since the last snapshot
+        atexit.register(self.close)
     
     def _load_all(self):
         # Load apriori patterns
         apriori_file = self.apriori_path / "validated_patterns.json"
         if apriori_file.exists():
-            with open(apriori_file, 'r') as f:
-                data = json.load(f)
+            with open(apriori_file, 'rb') as f:
+                data = _loads(f.read())
                 self.apriori_patterns = {
-                    k: AprioriPattern(**v) for k, v in data.items()
+                    k: AprioriPattern.from_dict_fast(v) for k, v in data.items()
                 }
         
+        # Replay promotions made since the last snapshot
+        delta_file = self.apriori_path / "apriori_delta.jsonl"
+        if delta_file.exists():
+            with open(delta_file, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = _loads(line)
+                        self.apriori_patterns[entry["k"]] = AprioriPattern.from_dict_fast(entry["v"])
+                    except:
+                        continue
+        
         # Load tracelog
         trace_file = self.trace_path / "verdict_log.jsonl"
         if trace_file.exists():
-            with open(trace_file, 'r') as f:
-                for line in f.readlines()[-1000:]:
+            with open(trace_file, 'rb') as f:
+                for line in _tail_lines(f, self.verdict_tracelog.maxlen):
                     try:
-                        self.verdict_tracelog.append(VerdictTrace(**json.loads(line)))
+                        self._push_trace(VerdictTrace.from_dict_fast(_loads(line)))
                     except:
                         continue
         
         # Load accuracy tracking
         acc_file = self.vault_path / "pattern_accuracy.json"
         if acc_file.exists():
-            with open(acc_file, 'r') as f:
-                self.pattern_accuracy = json.load(f)
+            with open(acc_file, 'rb') as f:
+                self.pattern_accuracy = {
+                    k: [v["correct"], v["total"]] for k, v in _loads(f.read()).items()
+                }
+            for pattern in self.pattern_accuracy:
+                self._sync_accuracy(pattern)
     
-    def record_verdict(self, prediction: Dict, context: Dict) -> str:
-        """Record inductive verdict before outcome is known."""
-        verdict_id = hashlib.sha256(
-            f"{prediction['pattern']}{time.time()}".encode()
-        ).hexdigest()[:16]
+    def record_verdict(self, prediction: Dict, context: Dict) -> Tuple[str, float]:
+        """Record inductive verdict before outcome is known; returns (verdict_id, ethics_score)."""
+        now_ns = time.time_ns()
+        now = now_ns / 1e9
+        # 48-bit nanosecond tag + 16-bit counter: 16 hex chars, unique within the process
+        verdict_id = f"{now_ns & 0xFFFFFFFFFFFF:012x}{next(self._verdict_counter) & 0xFFFF:04x}"
         
         # Ethics alignment: consistency with apriori patterns
         ethics_score = self._calculate_ethics_alignment(prediction)
         
         trace = VerdictTrace(
             verdict_id=verdict_id,
-            timestamp=time.time(),
+            timestamp=now,
             pattern_predicted=prediction["pattern"],
             confidence=prediction["confidence"],
             ethics_alignment=ethics_score,
             vivacity_at_time=prediction.get("vivacity", 0)
         )
         
-        self.verdict_tracelog.append(trace)
+        self._push_trace(trace)
         
-        # Save immediately
-        with open(self.trace_path / "verdict_log.jsonl", 'a') as f:
-            f.write(json.dumps(asdict(trace)) + '\n')
+        self._append_trace(_dumpb(trace.to_dict()) + b'\n', now)
         
-        return verdict_id
+        return verdict_id, ethics_score
+
+    def flush(self):
+        """Write buffered tracelog lines with a single write() and flush the handle."""
+        if self._trace_buf:
+            data = b''.join(self._trace_buf)
+            self._trace_buf.clear()
+            if self._writer is not None:
+                self._writer.submit(data)
+            else:
+                self._trace_fh.write(data)
+        if self._writer is None:
+            self._trace_fh.flush()
+        self._last_trace_flush = time.time()
+    
+    def _append_trace(self, line: bytes, now: float):
+        """Buffer one tracelog line; flush every TRACE_FLUSH_EVERY lines or TRACE_FLUSH_INTERVAL seconds."""
+        self._trace_buf.append(line)
+        if (len(self._trace_buf) >= TRACE_FLUSH_EVERY
+                or now - self._last_trace_flush >= TRACE_FLUSH_INTERVAL):
+            self.flush()
+    
+    def close(self):
+        """Flush and release the tracelog and apriori delta handles."""
+        if not self._trace_fh.closed:
+            self.flush()
+            if self._writer is not None:
+                self._writer.close()
+            self._trace_fh.close()
+        if not self._apriori_fh.closed:
+            self._apriori_fh.close()
+    
+    def _push_trace(self, trace: VerdictTrace):
+        """Append to the tracelog, dropping the evicted trace from the id index."""
+        log = self.verdict_tracelog
+        if len(log) == log.maxlen:
+            evicted = log[0]
+            self._trace_by_id.pop(evicted.verdict_id, None)
+            self._count_trace(evicted, -1)
+        log.append(trace)
+        self._trace_by_id[trace.verdict_id] = trace
+        self._count_trace(trace, 1)
+    
+    def _count_trace(self, trace: VerdictTrace, sign: int):
+        if trace.confidence > 0.5:
+            self._n_high_conf += sign
+            if trace.was_correct:
+                self._correct_high_conf += sign
     
     def validate_verdict(self, verdict_id: str, actual_outcome: str):
         """Update trace with actual outcome."""
-        for trace in self.verdict_tracelog:
-            if trace.verdict_id == verdict_id:
-                trace.actual_outcome = actual_outcome
-                trace.was_correct = (actual_outcome == trace.pattern_predicted)
-                trace.validation_time = time.time()
-                
-                # Update pattern accuracy
-                pattern = trace.pattern_predicted
-                if pattern not in self.pattern_accuracy:
-                    self.pattern_accuracy[pattern] = {"correct": 0, "total": 0}
-                
-                self.pattern_accuracy[pattern]["total"] += 1
-                if trace.was_correct:
-                    self.pattern_accuracy[pattern]["correct"] += 1
-                    self._promote_to_apriori(pattern, trace)
-                
-                self._save_accuracy()
-                break
+        trace = self._trace_by_id.get(verdict_id)
+        if trace is None:
+            return
+        
+        self._count_trace(trace, -1)
+        trace.actual_outcome = actual_outcome
+        trace.was_correct = (actual_outcome == trace.pattern_predicted)
+        trace.validation_time = time.time()
+        self._count_trace(trace, 1)
+        
+        # Update pattern accuracy
+        pattern = trace.pattern_predicted
+        stats = self.pattern_accuracy.get(pattern)
+        if stats is None:
+            stats = self.pattern_accuracy[pattern] = [0, 0]
+        
+        stats[1] += 1
+        if trace.was_correct:
+            stats[0] += 1
+        self._sync_accuracy(pattern)
+        if trace.was_correct:
+            self._promote_to_apriori(pattern, trace)
+        
+        self._save_accuracy()
+    
+    def historical_accuracy(self, patterns: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-pattern accuracy from the column mirror, and a mask of patterns that have stats.
+        
+        Known patterns with no validations yet read as 0.5, matching advise_orb.
+        """
+        idx = np.fromiter((self._pa_index.get(p, -1) for p in patterns), dtype=np.int64, count=len(patterns))
+        known = idx >= 0
+        rows = idx[known]
+        total = self._pa_total[rows]
+        acc = np.full(len(patterns), 0.5)
+        acc[known] = np.where(total > 0, self._pa_correct[rows] / np.maximum(total, 1), 0.5)
+        return acc, known
+    
+    def _sync_accuracy(self, pattern: str):
+        """Copy one pattern's counts from pattern_accuracy into the column mirror."""
+        i = self._pa_index.get(pattern)
+        if i is None:
+            i = self._pa_index[pattern] = len(self._pa_keys)
+            self._pa_keys.append(pattern)
+            if i == len(self._pa_total):
+                self._pa_correct = np.concatenate([self._pa_correct, np.zeros_like(self._pa_correct)])
+                self._pa_total = np.concatenate([self._pa_total, np.zeros_like(self._pa_total)])
+                self._pa_mask = np.zeros(len(self._pa_total), dtype=bool)
+        stats = self.pattern_accuracy[pattern]
+        self._pa_correct[i] = stats[0]
+        self._pa_total[i] = stats[1]
     
     def _promote_to_apriori(self, pattern: str, trace: VerdictTrace):
         """Move frequently correct patterns to apriori."""
-        stats = self.pattern_accuracy[pattern]
-        if stats["total"] >= 5 and (stats["correct"] / stats["total"]) > 0.8:
+        correct, total = self.pattern_accuracy[pattern]
+        if total >= 5 and (correct / total) > 0.8:
             if pattern in self.conjunction_memory:
                 conj = self.conjunction_memory[pattern]
                 
                 self.apriori_patterns[pattern] = AprioriPattern(
                     pattern_key=pattern,
                     frequency=conj.frequency,
-                    predictive_accuracy=stats["correct"] / stats["total"],
+                    predictive_accuracy=correct / total,
                     ethics_score=trace.ethics_alignment,
-                    validated_count=stats["correct"],
+                    validated_count=correct,
                     first_seen=conj.last_observed - (conj.observations * 3600)
                 )
-                
-                # Save apriori
-                with open(self.apriori_path / "validated_patterns.json", 'w') as f:
-                    json.dump({k: asdict(v) for k, v in self.apriori_patterns.items()}, f)
+                self._log_apriori(pattern)
+    
+    def _log_apriori(self, key: str):
+        """Append one promotion to the delta log; rewrite the snapshot every APRIORI_SNAPSHOT_EVERY deltas."""
+        self._apriori_fh.write(_dumps({"k": key, "v": self.apriori_patterns[key].to_dict()}) + '\n')
+        self._apriori_deltas += 1
+        if self._apriori_deltas >= APRIORI_SNAPSHOT_EVERY:
+            self._save_apriori()
+    
+    def _save_apriori(self):
+        """Rewrite validated_patterns.json and truncate the delta log it now covers."""
+        with open(self.apriori_path / "validated_patterns.json", 'w') as f:
+            f.write(_dumps({k: v.to_dict() for k, v in self.apriori_patterns.items()}))
+        self._apriori_fh.seek(0)
+        self._apriori_fh.truncate()
+        self._apriori_deltas = 0
     
     def _calculate_ethics_alignment(self, prediction: Dict) -> float:
         """
@@ -152,56 +340,74 @@ class InductiveCognition:
         """
         score = 0.0
         
-        # Check against apriori
-        pattern = prediction["pattern"]
-        if pattern in self.apriori_patterns:
-            ap = self.apriori_patterns[pattern]
-            score += ap.predictive_accuracy * 0.5
-        
         confidence = prediction.get("confidence", 0)
         if 0.4 <= confidence <= 0.8:  # Sweet spot - not over/under confident
             score += 0.3
         
+        # Check against apriori
+        pattern = prediction["pattern"]
+        ap = self.apriori_patterns.get(pattern)
+        if ap is not None:
+            score += ap.predictive_accuracy * 0.5
+        
         # Simplicity bonus (shorter patterns preferred)
-        pattern_length = len(pattern.split("→"))
+        pattern_length = self._plen_cache.get(pattern)
+        if pattern_length is None:
+            pattern_length = self._plen_cache[pattern] = pattern.count("→") + 1
         score += max(0, (5 - pattern_length) * 0.04)
         
         return min(score, 1.0)
     
     def idle_recursive_process(self) -> Dict:
         """Improve confidence calculations based on historical accuracy."""
+        self.flush()
         if len(self.verdict_tracelog) < 20:
             return {"processed": 0}
         
         improvements = []
         
         # Adjust confidence thresholds based on actual accuracy
-        correct_high_conf = [t for t in self.verdict_tracelog 
-                            if t.was_correct and t.confidence > 0.5]
-        wrong_high_conf = [t for t in self.verdict_tracelog 
-                          if not t.was_correct and t.confidence > 0.5]
+        # (unvalidated high-confidence traces count as wrong, as before)
+        correct_high_conf = self._correct_high_conf
+        wrong_high_conf = self._n_high_conf - correct_high_conf
         
-        if len(wrong_high_conf) > len(correct_high_conf) * 0.3:
+        if wrong_high_conf > correct_high_conf * 0.3:
             # We're overconfident - adjust vivacity scaling
             self.vivacity_threshold = min(1.0, self.vivacity_threshold * 1.1)
             improvements.append("Reduced confidence bias (overconfidence detected)")
         
         # Promote strong patterns to premise-like status
-        for pattern, stats in self.pattern_accuracy.items():
-            if stats["total"] > 10 and (stats["correct"]/stats["total"]) > 0.85:
-                if pattern not in self.apriori_patterns:
-                    self._promote_to_apriori(pattern, 
-                        next(t for t in self.verdict_tracelog if t.pattern_predicted == pattern))
-                    improvements.append(f"Promoted {pattern} to apriori")
+        n = len(self._pa_keys)
+        correct = self._pa_correct[:n]
+        total = self._pa_total[:n]
+        ratios = correct / np.maximum(total, 1)
+        
+        first_trace = None  # pattern -> oldest trace still logged, built on first use
+        promote = _scan_promotions(ratios, total, self._pa_mask[:n], 10, 0.85)
+        for i in np.flatnonzero(promote):
+            pattern = self._pa_keys[i]
+            if pattern not in self.apriori_patterns:
+                if first_trace is None:
+                    first_trace = {}
+                    for t in self.verdict_tracelog:
+                        first_trace.setdefault(t.pattern_predicted, t)
+                trace = first_trace.get(pattern)
+                if trace is None:  # every trace for it has rotated out
+                    continue
+                self._promote_to_apriori(pattern, trace)
+                improvements.append(f"Promoted {pattern} to apriori")
+        
+        if self._apriori_deltas:
+            self._save_apriori()
         
+        seen = np.flatnonzero(total > 0)
         return {
             "processed": len(self.verdict_tracelog),
             "improvements": improvements,
             "apriori_patterns": len(self.apriori_patterns),
             "accuracy_rates": {
-                k: v["correct"]/v["total"] 
-                for k, v in self.pattern_accuracy.items() 
-                if v["total"] > 0
+                self._pa_keys[i]: rate
+                for i, rate in zip(seen.tolist(), ratios[seen].tolist())
             }
         }
     
@@ -213,4 +419,6 @@ class InductiveCognition:
     
     def _save_accuracy(self):
         with open(self.vault_path / "pattern_accuracy.json", 'w') as f:
-            json.dump(self.pattern_accuracy, f)
\ No newline at end of file
+            f.write(_dumps({
+                k: {"correct": v[0], "total": v[1]} for k, v in self.pattern_accuracy.items()
+            }))
\ No newline at end of file
@@ -1,4 +1,6 @@
 from pathlib import Path
+from typing import Dict, List
+import numpy as np
 from .cognitive_state import InductiveCognition
 
 class InductiveEngine:
@@ -25,30 +27,63 @@ class InductiveEngine:
         
         if prediction["predictive"]:
             # Record for tracking
-            verdict_id = self.cognition.record_verdict(prediction, stimulus)
+            verdict_id, ethics_score = self.cognition.record_verdict(prediction, stimulus)
             
             # Adjust confidence by historical accuracy
             pattern = prediction["pattern"]
-            if pattern in self.cognition.pattern_accuracy:
-                stats = self.cognition.pattern_accuracy[pattern]
-                historical_acc = stats["correct"] / stats["total"] if stats["total"] > 0 else 0.5
+            stats = self.cognition.pattern_accuracy.get(pattern)
+            if stats is not None:
+                correct, total = stats
+                historical_acc = correct / total if total > 0 else 0.5
                 adjusted_conf = prediction["confidence"] * (0.5 + 0.5 * historical_acc)
             else:
                 adjusted_conf = prediction["confidence"] * 0.8  # Penalty for novel patterns
             
-            return {
-                "advisory_type": "inductive",
-                "verdict_id": verdict_id,
-                "verdict": "pattern_continuation_likely",
-                "conclusion": prediction["predicted_next"],
-                "confidence": adjusted_conf,
-                "raw_confidence": prediction["confidence"],
-                "vivacity": prediction["vivacity"],
-                "ethics_alignment": self.cognition._calculate_ethics_alignment(prediction),
-                "deterministic": False,
-                "weight": adjusted_conf * 0.3
-            }
+            return self._advisory(prediction, verdict_id, ethics_score, adjusted_conf)
         
+        return self._novel_advisory()
+    
+    def advise_orb_batch(self, stimuli: List[Dict], hlsf_contexts: List[Dict]) -> List[Dict]:
+        """advise_orb over a batch; confidence adjustment runs as one NumPy expression.
+        
+        Recording a verdict does not change pattern accuracy, so adjusting
+        every prediction against the current stats before recording gives the
+        same advisories as calling advise_orb once per stimulus.
+        """
+        predictions = []
+        for stimulus in stimuli:
+            self.observe_stimulus(stimulus)
+            predictions.append(self.predict_next())
+        
+        hits = [i for i, p in enumerate(predictions) if p["predictive"]]
+        results = [None] * len(predictions)
+        if hits:
+            acc, known = self.cognition.historical_accuracy([predictions[i]["pattern"] for i in hits])
+            raw = np.array([predictions[i]["confidence"] for i in hits], dtype=float)
+            adjusted = np.where(known, raw * (0.5 + 0.5 * acc), raw * 0.8)
+            for i, adjusted_conf in zip(hits, adjusted.tolist()):
+                verdict_id, ethics_score = self.cognition.record_verdict(predictions[i], stimuli[i])
+                results[i] = self._advisory(predictions[i], verdict_id, ethics_score, adjusted_conf)
+        
+        return [r if r is not None else self._novel_advisory() for r in results]
+    
+    @staticmethod
+    def _advisory(prediction: Dict, verdict_id: str, ethics_score: float, adjusted_conf: float) -> Dict:
+        return {
+            "advisory_type": "inductive",
+            "verdict_id": verdict_id,
+            "verdict": "pattern_continuation_likely",
+            "conclusion": prediction["predicted_next"],
+            "confidence": adjusted_conf,
+            "raw_confidence": prediction["confidence"],
+            "vivacity": prediction["vivacity"],
+            "ethics_alignment": ethics_score,
+            "deterministic": False,
+            "weight": adjusted_conf * 0.3
+        }
+    
+    @staticmethod
+    def _novel_advisory() -> Dict:
         return {
             "advisory_type": "inductive",
             "verdict_id": None,
@@ -64,4 +99,4 @@ class InductiveEngine:
         return self.cognition.idle_recursive_process()
     
     def export_tracelog(self):
-        return [asdict(t) for t in self.cognition.verdict_tracelog if t.was_correct is not None]
\ No newline at end of file
+        return [t.to_dict() for t in self.cognition.verdict_tracelog if t.was_correct is not None]
\ No newline at end of file
@@ -58,20 +58,20 @@ class InductiveValidator:
             }
         
         # Check against internal history
-        support_data = self.cognition.pattern_support.get(pattern, {"checks": 0, "supports": 0})
+        support_data = self.cognition.pattern_support.get(pattern)
+        checks = support_data["checks"] if support_data is not None else 0
         
-        if support_data["checks"] > 0:
-            freq = support_data["supports"] / support_data["checks"]
+        if checks > 0:
+            freq = support_data["supports"] / checks
         else:
             freq = 0.0
         
-        # Find similar patterns (simple substring match for demo)
-        similar = [p for p in self.cognition.pattern_support.keys() 
-                  if pattern in p or p in pattern and p != pattern][:3]
+        # Find similar patterns (substring match through the n-gram index)
+        similar = self.cognition.similar_patterns(pattern, 3)
         
         return {
             "frequency": freq,
-            "count": support_data["checks"],
+            "count": checks,
             "alignment": "supported" if freq > 0.6 else "weak_support",
             "similar_patterns": similar
         }
@@ -1,12 +1,24 @@
 """Pattern validation observation records."""
-import json
+import atexit
 import time
 import hashlib
 from pathlib import Path
-from typing import Dict, List
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Set
+from dataclasses import dataclass, fields
 from collections import deque
 
+from seed_io import BackgroundWriter as _BackgroundWriter, THREADED_LOGS, dumps as _dumps, dumpb as _dumpb, loads as _loads, tail_lines as _tail_lines, write_atomic as _write_atomic
+
+PATTERN_NGRAM = 4  # characters per key in the similar-pattern index
+
+def _ngrams(pattern: str) -> Set[str]:
+    return {pattern[i:i + PATTERN_NGRAM] for i in range(len(pattern) - PATTERN_NGRAM + 1)}
+
+TRACE_FLUSH_EVERY = 64       # records
+TRACE_FLUSH_INTERVAL = 1.0   # seconds since the last flush
+SUPPORT_SNAPSHOT_EVERY = 256 # support deltas before pattern_support.json is rewritten
+
+
 @dataclass
 class PatternValidation:
     validation_id: str
@@ -18,6 +30,29 @@ class PatternValidation:
     observation_count: int
     notes: List[str]
 
+    def to_dict(self) -> Dict:
+        return {
+            "validation_id": self.validation_id,
+            "timestamp": self.timestamp,
+            "verdict_pattern": self.verdict_pattern,
+            "predicted_continuation": self.predicted_continuation,
+            "historical_support": self.historical_support,
+            "alignment": self.alignment,
+            "observation_count": self.observation_count,
+            "notes": self.notes
+        }
+    
+    @classmethod
+    def from_dict_fast(cls, data: Dict) -> "PatternValidation":
+        """Restore a loaded record without running __init__ when it has exactly the dataclass fields."""
+        if data.keys() != _VALIDATION_FIELDS:
+            return cls(**data)
+        obj = object.__new__(cls)
+        obj.__dict__ = data
+        return obj
+
+_VALIDATION_FIELDS = frozenset(f.name for f in fields(PatternValidation))
+
 class InductiveValidationCognition:
     def __init__(self, vault_path: Path):
         self.vault_path = vault_path
@@ -26,27 +61,65 @@ class InductiveValidationCognition:
         self.validations: deque = deque(maxlen=5000)
         self.pattern_support: Dict[str, Dict] = {}
         
+        # Inverted n-gram index over pattern_support keys for similar_patterns
+        self._support_rank: Dict[str, int] = {}  # key -> insertion order
+        self._ngram_index: Dict[str, Set[str]] = {}
+        self._short_patterns: List[str] = []     # keys too short to have an n-gram
+        self._support_seq = 0  # sequence number of the latest support delta
+        
         self._load()
+        
+        # Long-lived append handle for the validation log; see flush
+        self._trace_fh = open(self.vault_path / "pattern_validations.jsonl", 'ab', buffering=1 << 16)
+        self._trace_buf: List[bytes] = []
+        self._writer = _BackgroundWriter(self._trace_fh) if THREADED_LOGS else None
+        self._last_trace_flush = time.time()
+        self._support_fh = open(self.vault_path / "pattern_support_delta.jsonl", 'a', buffering=1 << 16)
+        self._support_deltas = 0  # delta lines since the last snapshot
+        atexit.register(self.close)
     
     def _load(self):
         log_file = self.vault_path / "pattern_validations.jsonl"
         if log_file.exists():
-            with open(log_file, 'r') as f:
-                for line in list(f)[-5000:]:
+            with open(log_file, 'rb') as f:
+                for line in _tail_lines(f, self.validations.maxlen):
                     try:
-                        self.validations.append(PatternValidation(**json.loads(line)))
+                        self.validations.append(PatternValidation.from_dict_fast(_loads(line)))
                     except:
                         continue
         
         # Load historical pattern support data
         support_file = self.vault_path / "pattern_support.json"
         if support_file.exists():
-            with open(support_file, 'r') as f:
-                self.pattern_support = json.load(f)
+            with open(support_file, 'rb') as f:
+                data = _loads(f.read())
+            if data.keys() == {"seq", "patterns"}:
+                self._support_seq = data["seq"]
+                data = data["patterns"]
+            self.pattern_support = data
+            for pattern in self.pattern_support:
+                self._index_pattern(pattern)
+        
+        # Replay support checks made since the last snapshot, skipping any it already folded in
+        delta_file = self.vault_path / "pattern_support_delta.jsonl"
+        if delta_file.exists():
+            with open(delta_file, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = _loads(line)
+                        seq = entry.get("n")
+                        if seq is not None:
+                            if seq <= self._support_seq:
+                                continue
+                            self._support_seq = seq
+                        self._count_support(entry["p"], entry["s"])
+                    except:
+                        continue
     
     def record_validation(self, verdict: Dict, historical_check: Dict) -> str:
         """Document pattern validation."""
-        v_id = f"val_{int(time.time()*1000)}"
+        now = time.time()
+        v_id = f"val_{int(now*1000)}"
         
         pattern = verdict.get("pattern", "unknown")
         prediction = verdict.get("predicted_next", "unknown")
@@ -62,7 +135,7 @@ class InductiveValidationCognition:
         
         val = PatternValidation(
             validation_id=v_id,
-            timestamp=time.time(),
+            timestamp=now,
             verdict_pattern=pattern,
             predicted_continuation=prediction,
             historical_support=support,
@@ -73,22 +146,110 @@ class InductiveValidationCognition:
         
         self.validations.append(val)
         
-        with open(self.vault_path / "pattern_validations.jsonl", 'a') as f:
-            f.write(json.dumps(asdict(val)) + '\n')
+        self._append_trace(_dumpb(val.to_dict()) + b'\n', now)
         
         # Update support stats
-        if pattern not in self.pattern_support:
-            self.pattern_support[pattern] = {"checks": 0, "supports": 0}
-        self.pattern_support[pattern]["checks"] += 1
-        if align == "supported":
-            self.pattern_support[pattern]["supports"] += 1
-        
-        with open(self.vault_path / "pattern_support.json", 'w') as f:
-            json.dump(self.pattern_support, f)
+        supported = 1 if align == "supported" else 0
+        self._count_support(pattern, supported)
+        self._support_seq += 1
+        self._support_fh.write(_dumps({"n": self._support_seq, "p": pattern, "s": supported}) + '\n')
+        self._support_deltas += 1
+        if self._support_deltas >= SUPPORT_SNAPSHOT_EVERY:
+            self._snapshot_support()
         
         return v_id
     
+    def _count_support(self, pattern: str, supported: int):
+        stats = self.pattern_support.get(pattern)
+        if stats is None:
+            stats = self.pattern_support[pattern] = {"checks": 0, "supports": 0}
+            self._index_pattern(pattern)
+        stats["checks"] += 1
+        stats["supports"] += supported
+    
+    def _snapshot_support(self):
+        """Atomically rewrite pattern_support.json, then truncate the delta log it now covers.
+        
+        The snapshot records the last delta sequence number folded into it, so a crash
+        before the truncate cannot replay those deltas a second time.
+        """
+        _write_atomic(self.vault_path / "pattern_support.json",
+                      _dumps({"seq": self._support_seq, "patterns": self.pattern_support}))
+        self._support_fh.seek(0)
+        self._support_fh.truncate()
+        self._support_deltas = 0
+    
+    def _index_pattern(self, pattern: str):
+        self._support_rank[pattern] = len(self._support_rank)
+        grams = _ngrams(pattern)
+        if not grams:
+            self._short_patterns.append(pattern)
+        for gram in grams:
+            self._ngram_index.setdefault(gram, set()).add(pattern)
+    
+    def similar_patterns(self, pattern: str, limit: int = 3) -> List[str]:
+        """Other known patterns related to pattern by substring, in first-seen order.
+        
+        A key containing pattern shares all of its n-grams, and a key contained
+        in it has only n-grams of pattern, so the posting lists for pattern's
+        n-grams (plus the unindexable short keys) hold every match.
+        """
+        grams = _ngrams(pattern)
+        if grams:
+            candidates = set(self._short_patterns)
+            for gram in grams:
+                candidates.update(self._ngram_index.get(gram, ()))
+            candidates = sorted(candidates, key=self._support_rank.__getitem__)
+        else:
+            candidates = self.pattern_support  # too short to look up; scan every key
+        
+        lp = len(pattern)
+        similar = []
+        for p in candidates:
+            if len(p) == lp:  # containment at equal length is pattern itself
+                continue
+            if pattern in p or p in pattern:
+                similar.append(p)
+                if len(similar) == limit:
+                    break
+        return similar
+
+    def flush(self):
+        """Write buffered validation log lines with a single write() and flush both handles."""
+        if self._trace_buf:
+            data = b''.join(self._trace_buf)
+            self._trace_buf.clear()
+            if self._writer is not None:
+                self._writer.submit(data)
+            else:
+                self._trace_fh.write(data)
+        if self._writer is None:
+            self._trace_fh.flush()
+        self._support_fh.flush()
+        self._last_trace_flush = time.time()
+    
+    def _append_trace(self, line: bytes, now: float):
+        """Buffer one validation log line; flush every TRACE_FLUSH_EVERY lines or TRACE_FLUSH_INTERVAL seconds."""
+        self._trace_buf.append(line)
+        if (len(self._trace_buf) >= TRACE_FLUSH_EVERY
+                or now - self._last_trace_flush >= TRACE_FLUSH_INTERVAL):
+            self.flush()
+    
+    def close(self):
+        """Flush and release the validation log; roll pending support deltas into the snapshot."""
+        if not self._trace_fh.closed:
+            self.flush()
+            if self._writer is not None:
+                self._writer.close()
+            self._trace_fh.close()
+        if not self._support_fh.closed:
+            if self._support_deltas:
+                self._snapshot_support()
+            self._support_fh.close()
+    
     def get_stats(self) -> Dict:
+        if self._support_deltas:
+            self._snapshot_support()
         total = len(self.validations)
         if not total:
             return {}
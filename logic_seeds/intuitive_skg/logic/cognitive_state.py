@@ -1,11 +1,18 @@
-import json
+import atexit
+import itertools
 import time
-import hashlib
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
 from collections import deque
 
+from seed_io import BackgroundWriter as _BackgroundWriter, THREADED_LOGS, dumps as _dumps, dumpb as _dumpb, loads as _loads, tail_lines as _tail_lines
+
+TRACE_FLUSH_EVERY = 64       # records
+TRACE_FLUSH_INTERVAL = 1.0   # seconds since the last flush
+APRIORI_SNAPSHOT_EVERY = 32  # delta lines before unity_conditions.json is rewritten
+
+
 @dataclass
 class NecessityVerdict:
     verdict_id: str
@@ -13,21 +20,96 @@ class NecessityVerdict:
     symmetry_score: float
     density: int
     certainty: float
-    vector: Tuple[float, float]
+    vector_x: float
+    vector_y: float
     bypass_depth: int
     ethics_alignment: float
     validated: Optional[bool] = None
     validation_time: Optional[float] = None
 
+    def to_dict(self) -> Dict:
+        return {
+            "verdict_id": self.verdict_id,
+            "timestamp": self.timestamp,
+            "symmetry_score": self.symmetry_score,
+            "density": self.density,
+            "certainty": self.certainty,
+            "vector_x": self.vector_x,
+            "vector_y": self.vector_y,
+            "bypass_depth": self.bypass_depth,
+            "ethics_alignment": self.ethics_alignment,
+            "validated": self.validated,
+            "validation_time": self.validation_time
+        }
+    
+    @classmethod
+    def from_dict_fast(cls, data: Dict) -> "NecessityVerdict":
+        """Restore a loaded record without running __init__ when it has exactly the dataclass fields."""
+        if data.keys() != _VERDICT_FIELDS:
+            return cls.from_dict(data)
+        obj = object.__new__(cls)
+        obj.__dict__ = data
+        return obj
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "NecessityVerdict":
+        """Build from a log line, accepting the older two-element "vector" field."""
+        if "vector" in data:
+            data = dict(data)
+            data["vector_x"], data["vector_y"] = data.pop("vector")
+        return cls(**data)
+    
+    @property
+    def vector(self) -> Tuple[float, float]:
+        return (self.vector_x, self.vector_y)
+
+_VERDICT_FIELDS = frozenset(f.name for f in fields(NecessityVerdict))
+
 @dataclass
 class AprioriNecessity:
     condition_hash: str  # Hash of density+symmetry thresholds
-    unity_vector: Tuple[float, float]
+    unity_vector_x: float
+    unity_vector_y: float
     validation_count: int
     average_certainty: float
     ethics_score: float
 
+    def to_dict(self) -> Dict:
+        return {
+            "condition_hash": self.condition_hash,
+            "unity_vector_x": self.unity_vector_x,
+            "unity_vector_y": self.unity_vector_y,
+            "validation_count": self.validation_count,
+            "average_certainty": self.average_certainty,
+            "ethics_score": self.ethics_score
+        }
+    
+    @classmethod
+    def from_dict_fast(cls, data: Dict) -> "AprioriNecessity":
+        """Restore a loaded record without running __init__ when it has exactly the dataclass fields."""
+        if data.keys() != _APRIORI_FIELDS:
+            return cls.from_dict(data)
+        obj = object.__new__(cls)
+        obj.__dict__ = data
+        return obj
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "AprioriNecessity":
+        """Build from a snapshot entry, accepting the older two-element "unity_vector" field."""
+        if "unity_vector" in data:
+            data = dict(data)
+            data["unity_vector_x"], data["unity_vector_y"] = data.pop("unity_vector")
+        return cls(**data)
+    
+    @property
+    def unity_vector(self) -> Tuple[float, float]:
+        return (self.unity_vector_x, self.unity_vector_y)
+
+_APRIORI_FIELDS = frozenset(f.name for f in fields(AprioriNecessity))
+
 class IntuitiveCognition:
+    _verdict_counter = itertools.count()  # shared so ids stay unique across instances
+    
     def __init__(self, vault_path: Path):
         self.vault_path = vault_path
         self.vault_path.mkdir(parents=True, exist_ok=True)
@@ -42,108 +124,198 @@ class IntuitiveCognition:
         self.trace_path.mkdir(exist_ok=True)
         
         self.necessity_tracelog: deque = deque(maxlen=1000)
+        self._verdict_by_id: Dict[str, NecessityVerdict] = {}  # verdict_id -> verdict still in the deque
+        # Running symmetry totals over validated verdicts still in the tracelog
+        self._n_valid = 0
+        self._sum_sym_valid = 0.0
+        self._n_invalid = 0
+        self._sum_sym_invalid = 0.0
         self.apriori_necessities: Dict[str, AprioriNecessity] = {}
         
         # Track field state accuracy
         self.field_predictions: List[Dict] = []
         
         self._load_all()
+        
+        # Long-lived append handle for the necessity log; see flush
+        self._trace_fh = open(self.trace_path / "necessity_log.jsonl", 'ab', buffering=1 << 16)
+        self._trace_buf: List[bytes] = []
+        self._writer = _BackgroundWriter(self._trace_fh) if THREADED_LOGS else None
+        self._last_trace_flush = time.time()
+        self._apriori_fh = open(self.apriori_path / "apriori_delta.jsonl", 'a', buffering=1)
+        self._apriori_deltas = 0  # delta lines since the last snapshot
+        atexit.register(self.close)
     
     def _load_all(self):
         # Load apriori necessities
         ap_file = self.apriori_path / "unity_conditions.json"
         if ap_file.exists():
-            with open(ap_file, 'r') as f:
-                data = json.load(f)
+            with open(ap_file, 'rb') as f:
+                data = _loads(f.read())
                 self.apriori_necessities = {
-                    k: AprioriNecessity(**v) for k, v in data.items()
+                    k: AprioriNecessity.from_dict_fast(v) for k, v in data.items()
                 }
         
+        # Replay promotions made since the last snapshot
+        delta_file = self.apriori_path / "apriori_delta.jsonl"
+        if delta_file.exists():
+            with open(delta_file, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = _loads(line)
+                        self.apriori_necessities[entry["k"]] = AprioriNecessity.from_dict_fast(entry["v"])
+                    except:
+                        continue
+        
         # Load tracelog
         trace_file = self.trace_path / "necessity_log.jsonl"
         if trace_file.exists():
-            with open(trace_file, 'r') as f:
-                for line in f.readlines()[-1000:]:
+            with open(trace_file, 'rb') as f:
+                for line in _tail_lines(f, self.necessity_tracelog.maxlen):
                     try:
-                        self.necessity_tracelog.append(NecessityVerdict(**json.loads(line)))
+                        self._push_verdict(NecessityVerdict.from_dict_fast(_loads(line)))
                     except:
                         continue
     
     def record_necessity_verdict(self, necessity_data: Dict, context: Dict) -> str:
         """Record intuitive jump verdict."""
-        verdict_id = hashlib.sha256(
-            f"{necessity_data['density']}{necessity_data['symmetry']}{time.time()}".encode()
-        ).hexdigest()[:16]
+        now_ns = time.time_ns()
+        now = now_ns / 1e9
+        # 48-bit nanosecond tag + 16-bit counter: 16 hex chars, unique within the process
+        verdict_id = f"{now_ns & 0xFFFFFFFFFFFF:012x}{next(self._verdict_counter) & 0xFFFF:04x}"
         
         # Ethics: unity promotes coherence (high ethics)
         ethics_score = 0.3 + (0.7 * necessity_data.get("symmetry", 0))
         
+        vector_x, vector_y = necessity_data["vector"]
         verdict = NecessityVerdict(
             verdict_id=verdict_id,
-            timestamp=time.time(),
+            timestamp=now,
             symmetry_score=necessity_data["symmetry"],
             density=necessity_data["density"],
             certainty=necessity_data["certainty"],
-            vector=necessity_data["vector"],
+            vector_x=vector_x,
+            vector_y=vector_y,
             bypass_depth=necessity_data["bypass_depth"],
             ethics_alignment=ethics_score
         )
         
-        self.necessity_tracelog.append(verdict)
+        self._push_verdict(verdict)
         
-        with open(self.trace_path / "necessity_log.jsonl", 'a') as f:
-            f.write(json.dumps(asdict(verdict)) + '\n')
+        self._append_trace(_dumpb(verdict.to_dict()) + b'\n', now)
         
         return verdict_id
+
+    def flush(self):
+        """Write buffered necessity log lines with a single write() and flush the handle."""
+        if self._trace_buf:
+            data = b''.join(self._trace_buf)
+            self._trace_buf.clear()
+            if self._writer is not None:
+                self._writer.submit(data)
+            else:
+                self._trace_fh.write(data)
+        if self._writer is None:
+            self._trace_fh.flush()
+        self._last_trace_flush = time.time()
+    
+    def _append_trace(self, line: bytes, now: float):
+        """Buffer one necessity log line; flush every TRACE_FLUSH_EVERY lines or TRACE_FLUSH_INTERVAL seconds."""
+        self._trace_buf.append(line)
+        if (len(self._trace_buf) >= TRACE_FLUSH_EVERY
+                or now - self._last_trace_flush >= TRACE_FLUSH_INTERVAL):
+            self.flush()
+    
+    def close(self):
+        """Flush and release the necessity log and apriori delta handles."""
+        if not self._trace_fh.closed:
+            self.flush()
+            if self._writer is not None:
+                self._writer.close()
+            self._trace_fh.close()
+        if not self._apriori_fh.closed:
+            self._apriori_fh.close()
+    
+    def _push_verdict(self, verdict: NecessityVerdict):
+        """Append to the tracelog, dropping the evicted verdict from the id index."""
+        log = self.necessity_tracelog
+        if len(log) == log.maxlen:
+            evicted = log[0]
+            self._verdict_by_id.pop(evicted.verdict_id, None)
+            self._count_verdict(evicted, -1)
+        log.append(verdict)
+        self._verdict_by_id[verdict.verdict_id] = verdict
+        self._count_verdict(verdict, 1)
+    
+    def _count_verdict(self, verdict: NecessityVerdict, sign: int):
+        if verdict.validated:
+            self._n_valid += sign
+            self._sum_sym_valid += sign * verdict.symmetry_score
+        elif verdict.validated is False:
+            self._n_invalid += sign
+            self._sum_sym_invalid += sign * verdict.symmetry_score
     
     def validate_necessity(self, verdict_id: str, was_optimal: bool):
         """Check if the jump was actually optimal (saved time/resources)."""
-        for verdict in self.necessity_tracelog:
-            if verdict.verdict_id == verdict_id:
-                verdict.validated = was_optimal
-                verdict.validation_time = time.time()
-                
-                if was_optimal:
-                    # Create condition hash
-                    cond_hash = f"d{verdict.density}_s{int(verdict.symmetry_score*100)}"
-                    
-                    if cond_hash in self.apriori_necessities:
-                        ap = self.apriori_necessities[cond_hash]
-                        ap.validation_count += 1
-                        ap.average_certainty = (
-                            (ap.average_certainty * (ap.validation_count - 1) + verdict.certainty)
-                            / ap.validation_count
-                        )
-                    else:
-                        self.apriori_necessities[cond_hash] = AprioriNecessity(
-                            condition_hash=cond_hash,
-                            unity_vector=verdict.vector,
-                            validation_count=1,
-                            average_certainty=verdict.certainty,
-                            ethics_score=verdict.ethics_alignment
-                        )
-                    
-                    self._save_apriori()
-                break
+        verdict = self._verdict_by_id.get(verdict_id)
+        if verdict is None:
+            return
+        
+        self._count_verdict(verdict, -1)
+        verdict.validated = was_optimal
+        verdict.validation_time = time.time()
+        self._count_verdict(verdict, 1)
+        
+        if was_optimal:
+            # Create condition hash
+            cond_hash = f"d{verdict.density}_s{int(verdict.symmetry_score*100)}"
+            
+            if cond_hash in self.apriori_necessities:
+                ap = self.apriori_necessities[cond_hash]
+                ap.validation_count += 1
+                ap.average_certainty = (
+                    (ap.average_certainty * (ap.validation_count - 1) + verdict.certainty)
+                    / ap.validation_count
+                )
+            else:
+                self.apriori_necessities[cond_hash] = AprioriNecessity(
+                    condition_hash=cond_hash,
+                    unity_vector_x=verdict.vector_x,
+                    unity_vector_y=verdict.vector_y,
+                    validation_count=1,
+                    average_certainty=verdict.certainty,
+                    ethics_score=verdict.ethics_alignment
+                )
+            
+            self._log_apriori(cond_hash)
+    
+    def _log_apriori(self, key: str):
+        """Append one condition update to the delta log; rewrite the snapshot every APRIORI_SNAPSHOT_EVERY deltas."""
+        self._apriori_fh.write(_dumps({"k": key, "v": self.apriori_necessities[key].to_dict()}) + '\n')
+        self._apriori_deltas += 1
+        if self._apriori_deltas >= APRIORI_SNAPSHOT_EVERY:
+            self._save_apriori()
     
     def _save_apriori(self):
+        """Rewrite unity_conditions.json and truncate the delta log it now covers."""
         with open(self.apriori_path / "unity_conditions.json", 'w') as f:
-            json.dump({k: asdict(v) for k, v in self.apriori_necessities.items()}, f)
+            f.write(_dumps({k: v.to_dict() for k, v in self.apriori_necessities.items()}))
+        self._apriori_fh.seek(0)
+        self._apriori_fh.truncate()
+        self._apriori_deltas = 0
     
     def idle_recursive_process(self) -> Dict:
         """Refine symmetry thresholds based on validation."""
+        self.flush()
         if len(self.necessity_tracelog) < 10:
             return {"processed": 0}
         
         # Analyze which threshold combinations lead to valid jumps
-        valid_jumps = [v for v in self.necessity_tracelog if v.validated]
-        invalid_jumps = [v for v in self.necessity_tracelog if v.validated == False]
-        
         improvements = []
         
-        if valid_jumps and invalid_jumps:
-            avg_sym_valid = sum(v.symmetry_score for v in valid_jumps) / len(valid_jumps)
-            avg_sym_invalid = sum(v.symmetry_score for v in invalid_jumps) / len(invalid_jumps)
+        if self._n_valid and self._n_invalid:
+            avg_sym_valid = self._sum_sym_valid / self._n_valid
+            avg_sym_invalid = self._sum_sym_invalid / self._n_invalid
             
             if avg_sym_valid > avg_sym_invalid:
                 # Increase threshold slightly toward valid mean
@@ -152,9 +324,12 @@ class IntuitiveCognition:
                     self.unity_threshold = new_threshold
                     improvements.append(f"Adjusted symmetry threshold to {new_threshold:.3f}")
         
+        if self._apriori_deltas:
+            self._save_apriori()
+        
         return {
             "processed": len(self.necessity_tracelog),
-            "valid_jumps": len(valid_jumps),
+            "valid_jumps": self._n_valid,
             "improvements": improvements,
             "apriori_conditions": len(self.apriori_necessities)
         }
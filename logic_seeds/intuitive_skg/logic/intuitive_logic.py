@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Dict
 from .cognitive_state import IntuitiveCognition
 
 class IntuitiveEngine:
@@ -11,8 +11,45 @@ Any changes to this interface require full system validation.
 """
 from pathlib import Path
 from typing import Dict
+import numpy as np
 from .validation_state import IntuitiveValidationCognition
 
+MIRROR_BLOCK = 256
+
+
+def _count_mirrors(xs: np.ndarray, ys: np.ndarray, block: int = MIRROR_BLOCK) -> int:
+    """Count pairs i < j where x_i ~ -x_j and y_i ~ y_j (mirrored across the y axis).
+
+    Rows are compared in blocks against the columns from the block onwards, so
+    the intermediate mask is at most block x N instead of N x N. Both tests run
+    as branch-free ufuncs into scratch buffers that are reused across blocks.
+    """
+    n = len(xs)
+    if n < 2:
+        return 0
+    width = min(block, n)
+    diff = np.empty((width, n))
+    hit = np.empty((width, n), dtype=bool)
+    near = np.empty((width, n), dtype=bool)
+    mirrors = 0
+    for start in range(0, n - 1, block):
+        stop = min(start + block, n)
+        rows = stop - start
+        d = diff[:rows, :n - start]
+        h = hit[:rows, :n - start]
+        t = near[:rows, :n - start]
+        np.add(xs[start:stop, None], xs[None, start:], out=d)
+        np.abs(d, out=d)
+        np.less(d, 0.3, out=h)
+        np.subtract(ys[start:stop, None], ys[None, start:], out=d)
+        np.abs(d, out=d)
+        np.less(d, 0.3, out=t)
+        h &= t
+        # Columns past the block are all j > i; only the leading square needs the triangle
+        mirrors += int(np.count_nonzero(h[:, rows:]))
+        mirrors += int(np.count_nonzero(np.triu(h[:, :rows], 1)))
+    return mirrors
+
 class IntuitiveValidator:
     def __init__(self, worker_root: Path):
         self.root = worker_root
@@ -54,29 +91,29 @@ class IntuitiveValidator:
         
         density = len(field_map)
         
-        # Simple symmetry calc
-        coords = []
+        # Simple symmetry calc, on separate x / y columns
+        xs = []
+        ys = []
         for node in field_map.values():
             c = node.get("coordinates", [0, 0]) if isinstance(node, dict) else getattr(node, 'coordinates', [0, 0])
             if c and len(c) >= 2:
-                coords.append((float(c[0]), float(c[1])))
+                xs.append(float(c[0]))
+                ys.append(float(c[1]))
+        
+        n = len(xs)
+        xs = np.array(xs, dtype=np.float64)
+        ys = np.array(ys, dtype=np.float64)
         
-        if len(coords) < 2:
+        if n < 2:
             symmetry = 0.0
         else:
-            mirrors = 0
-            for i, c1 in enumerate(coords):
-                for c2 in coords[i+1:]:
-                    if abs(c1[0] + c2[0]) < 0.3 and abs(c1[1] - c2[1]) < 0.3:
-                        mirrors += 1
-            total = len(coords) * (len(coords) - 1) / 2
+            mirrors = _count_mirrors(xs, ys)
+            total = n * (n - 1) / 2
             symmetry = mirrors / total if total > 0 else 0.0
         
         # Centroid vector
-        if coords:
-            cx = sum(c[0] for c in coords) / len(coords)
-            cy = sum(c[1] for c in coords) / len(coords)
-            vector = (cx, cy)
+        if n:
+            vector = (float(xs.mean()), float(ys.mean()))
         else:
             vector = (0, 0)
         
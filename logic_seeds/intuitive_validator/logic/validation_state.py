@@ -1,12 +1,17 @@
 """Unity validation observations."""
-import json
+import atexit
 import time
 from pathlib import Path
 from typing import Dict, List, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from collections import deque
 
-@dataclass
+from seed_io import dumpb as _dumpb, loads as _loads, tail_lines as _tail_lines
+
+TRACE_FLUSH_EVERY = 64       # records
+TRACE_FLUSH_INTERVAL = 1.0   # seconds since the last flush
+
+@dataclass(slots=True)
 class UnityValidation:
     validation_id: str
     timestamp: float
@@ -17,6 +22,18 @@ class UnityValidation:
     vector_congruence: float
     notes: str
 
+    def to_dict(self) -> Dict:
+        return {
+            "validation_id": self.validation_id,
+            "timestamp": self.timestamp,
+            "field_density": self.field_density,
+            "symmetry_score": self.symmetry_score,
+            "unity_claimed": self.unity_claimed,
+            "unity_validated": self.unity_validated,
+            "vector_congruence": self.vector_congruence,
+            "notes": self.notes
+        }
+
 class IntuitiveValidationCognition:
     def __init__(self, vault_path: Path):
         self.vault_path = vault_path
@@ -25,21 +42,32 @@ class IntuitiveValidationCognition:
         self.validations: deque = deque(maxlen=5000)
         self.unity_history: List[Dict] = []
         
+        # Running totals over validations, kept in step on append/evict
+        self._validated_count = 0
+        self._congruence_sum = 0.0
+        self._evictions = 0  # since the last exact recount
+        
         self._load()
+        
+        self._trace_fh = open(self.vault_path / "unity_validations.jsonl", 'ab', buffering=1 << 16)
+        self._trace_buf: List[bytes] = []
+        self._last_trace_flush = time.time()
+        atexit.register(self.close)
     
     def _load(self):
         log_file = self.vault_path / "unity_validations.jsonl"
         if log_file.exists():
-            with open(log_file, 'r') as f:
-                for line in list(f)[-5000:]:
+            with open(log_file, 'rb') as f:
+                for line in _tail_lines(f, self.validations.maxlen):
                     try:
-                        self.validations.append(UnityValidation(**json.loads(line)))
+                        self._append_validation(UnityValidation(**_loads(line)))
                     except:
                         continue
     
     def record_unity_check(self, verdict: Dict, calculated: Dict) -> str:
         """Document unity claim verification."""
-        v_id = f"unity_{int(time.time()*1000)}"
+        now = time.time()
+        v_id = f"unity_{int(now*1000)}"
         
         claimed = verdict.get("unity_claimed", False)
         calc_symmetry = calculated.get("symmetry", 0)
@@ -63,7 +91,7 @@ class IntuitiveValidationCognition:
         
         val = UnityValidation(
             validation_id=v_id,
-            timestamp=time.time(),
+            timestamp=now,
             field_density=calculated.get("density", 0),
             symmetry_score=calc_symmetry,
             unity_claimed=claimed,
@@ -72,19 +100,66 @@ class IntuitiveValidationCognition:
             notes="Unity claim checked against field geometry"
         )
         
-        self.validations.append(val)
+        self._append_validation(val)
         
-        with open(self.vault_path / "unity_validations.jsonl", 'a') as f:
-            f.write(json.dumps(asdict(val)) + '\n')
+        self._append_trace(_dumpb(val.to_dict()) + b'\n', now)
         
         return v_id
     
+    def _append_validation(self, val: UnityValidation):
+        """Append to the bounded deque, updating the running stats for the evicted entry too."""
+        log = self.validations
+        if len(log) == log.maxlen:
+            self._count_validation(log[0], -1)
+            self._evictions += 1
+        log.append(val)
+        self._count_validation(val, 1)
+        if self._evictions >= log.maxlen:
+            self._recount()
+    
+    def _recount(self):
+        """Rebuild the running stats in one pass (bounds float drift in _congruence_sum)."""
+        validated = 0
+        congruence_sum = 0.0
+        for v in self.validations:
+            if v.unity_validated:
+                validated += 1
+            congruence_sum += v.vector_congruence
+        self._validated_count, self._congruence_sum = validated, congruence_sum
+        self._evictions = 0
+    
+    def _count_validation(self, val: UnityValidation, sign: int):
+        if val.unity_validated:
+            self._validated_count += sign
+        self._congruence_sum += sign * val.vector_congruence
+    
+    def flush(self):
+        """Write buffered unity log lines with a single write() and flush the handle."""
+        if self._trace_buf:
+            self._trace_fh.write(b''.join(self._trace_buf))
+            self._trace_buf.clear()
+        self._trace_fh.flush()
+        self._last_trace_flush = time.time()
+    
+    def _append_trace(self, line: bytes, now: float):
+        """Buffer one unity log line; flush every TRACE_FLUSH_EVERY lines or TRACE_FLUSH_INTERVAL seconds."""
+        self._trace_buf.append(line)
+        if (len(self._trace_buf) >= TRACE_FLUSH_EVERY
+                or now - self._last_trace_flush >= TRACE_FLUSH_INTERVAL):
+            self.flush()
+    
+    def close(self):
+        """Flush and release the unity log."""
+        if not self._trace_fh.closed:
+            self.flush()
+            self._trace_fh.close()
+    
     def get_stats(self):
-        if not self.validations:
+        total = len(self.validations)
+        if not total:
             return {}
-        validated = sum(1 for v in self.validations if v.unity_validated)
         return {
-            "total_checks": len(self.validations),
-            "unity_validated_rate": validated / len(self.validations),
-            "avg_congruence": sum(v.vector_congruence for v in self.validations) / len(self.validations)
+            "total_checks": total,
+            "unity_validated_rate": self._validated_count / total,
+            "avg_congruence": self._congruence_sum / total
         }
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""JSON and log-file helpers shared by the logic seeds and their validators.
+
+Entry points put this directory on sys.path next to their seed or validator
+package, and the logic modules import from here, so the orjson fallback and the
+log readers exist in exactly one place.
+"""
+import json
+import logging
+import os
+import queue
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+# SF_ORB_THREADED_LOGS=1 hands flushed batches to a writer thread instead of writing inline
+THREADED_LOGS = os.environ.get("SF_ORB_THREADED_LOGS") == "1"
+WRITER_QUEUE = 16   # pending batches before submit() applies backpressure
+WRITER_POLL = 0.5   # seconds between writer liveness checks while submit() waits
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serialize to JSON text, through orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+def dumpb(obj) -> bytes:
+    """Serialize to compact JSON bytes for the binary log handles."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode()
+
+def canonical(obj) -> bytes:
+    """Sorted-key, compact UTF-8 JSON bytes for hashing.
+    
+    orjson and the stdlib fallback produce the same bytes except for floats in
+    exponent form (orjson 1e-7 / 1e20, json 1e-07 / 1e+20) and non-finite floats
+    (orjson null, json NaN), so hashes over such values depend on the backend.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode()
+
+loads = orjson.loads if orjson is not None else json.loads
+
+def write_atomic(path: Path, text: str):
+    """Write via a sibling temp file and os.replace so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, 'w') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+def tail_lines(f, n: int, window: int = 512 * 1024) -> deque:
+    """Last n lines of a binary file, read from a tail window that doubles until it holds them."""
+    size = f.seek(0, os.SEEK_END)
+    while True:
+        start = max(0, size - window)
+        f.seek(start)
+        if start:
+            f.readline()  # drop the partial line the window starts in
+        lines = deque(f, maxlen=n)
+        if len(lines) == n or not start:
+            return lines
+        window *= 2
+
+
+class BackgroundWriter:
+    """Daemon thread that writes byte batches to a handle, coalescing whatever is queued per flush.
+    
+    A failed write is logged and dropped so the thread keeps draining. If the thread
+    stops anyway, submit() and close() write inline instead of waiting on the queue.
+    """
+    
+    def __init__(self, fh, maxsize: int = WRITER_QUEUE):
+        self._fh = fh
+        self._q: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def submit(self, data: bytes):
+        if not self._put(data):
+            self._write(data)
+    
+    def _put(self, item: Optional[bytes]) -> bool:
+        """Queue item for the writer thread; False once the thread has stopped."""
+        while self._thread.is_alive():
+            try:
+                self._q.put(item, timeout=WRITER_POLL)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _write(self, data: bytes):
+        try:
+            self._fh.write(data)
+        except Exception:
+            log.exception("Dropped %d bytes of log output", len(data))
+    
+    def _flush(self):
+        try:
+            self._fh.flush()
+        except Exception:
+            log.exception("Log flush failed")
+    
+    def _run(self):
+        while True:
+            data = self._q.get()
+            while data is not None:
+                self._write(data)
+                try:
+                    data = self._q.get_nowait()
+                except queue.Empty:
+                    break
+            self._flush()
+            if data is None:
+                return
+    
+    def close(self):
+        """Stop the thread once it has drained the queue; write anything it left behind inline."""
+        if self._put(None):
+            self._thread.join()
+        while True:
+            try:
+                data = self._q.get_nowait()
+            except queue.Empty:
+                break
+            if data is not None:
+                self._write(data)
+        self._flush()
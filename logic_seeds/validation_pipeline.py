@@ -11,15 +11,17 @@ Core logic MUST ONLY emit verdicts TO this pipeline for witnessing.
 The FinalValidationLayer.validate_for_delivery() is the ONLY entry point.
 Any changes to this interface require full system validation.
 """
-import json
+import atexit
 import sys
 import time
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict
 
 # Import all three validators
 current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir))  # seed_io, shared by the validators
 sys.path.insert(0, str(current_dir / "deductive_validator"))
 sys.path.insert(0, str(current_dir / "inductive_validator"))
 sys.path.insert(0, str(current_dir / "intuitive_validator"))
@@ -27,6 +29,9 @@ sys.path.insert(0, str(current_dir / "intuitive_validator"))
 from deductive_validator.logic.deductive_validation import DeductiveValidator
 from inductive_validator.logic.inductive_validation import InductiveValidator
 from intuitive_validator.logic.intuitive_validation import IntuitiveValidator
+from seed_io import canonical as _canonical, dumpb as _dumpb
+
+LOG_FLUSH_INTERVAL = 1.0  # seconds between flushes of the buffered delivery log
 
 class FinalValidationLayer:
     """
@@ -42,22 +47,47 @@ class FinalValidationLayer:
     - Signed envelopes provide tamper-evident provenance
     """
     
+    # The three validators read the package and write only their own state,
+    # so one delivery fans them out together
+    _pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="sf-orb-validator")
+    
     def __init__(self):
         self.deductive = DeductiveValidator(Path("deductive_validator"))
         self.inductive = InductiveValidator(Path("inductive_validator"))
         self.intuitive = IntuitiveValidator(Path("intuitive_validator"))
+        
+        self._log_fh = open("final_validation_log.jsonl", 'ab', buffering=1 << 16)
+        self._last_log_flush = time.time()
+        atexit.register(self.close)
+    
+    def flush(self):
+        """Push buffered delivery records, and each validator's log, to disk."""
+        self.inductive.cognition.flush()
+        self.intuitive.cognition.flush()
+        self._log_fh.flush()
+        self._last_log_flush = time.time()
     
-    def create_signed_witness_envelope(self, validation_record: Dict) -> Dict:
+    def close(self):
+        """Flush and release the delivery log."""
+        if not self._log_fh.closed:
+            self._log_fh.flush()
+            self._log_fh.close()
+    
+    def create_signed_witness_envelope(self, validation_record: Dict, verdict_hash: str = None) -> Dict:
         """
         Create a tamper-evident signed envelope containing all validator observations.
         Provides cryptographic provenance of what the system believed at delivery time.
+        
+        verdict_hash may be passed in when the caller has already hashed the
+        canonical original verdict; otherwise it is computed here.
         """
+        if verdict_hash is None:
+            verdict_hash = hashlib.sha256(_canonical(validation_record["original_verdict"])).hexdigest()[:16]
+        
         # Extract the core content to be signed
         envelope_content = {
             "delivery_timestamp": validation_record["delivery_timestamp"],
-            "original_verdict_hash": hashlib.sha256(
-                json.dumps(validation_record["original_verdict"], sort_keys=True).encode()
-            ).hexdigest()[:16],
+            "original_verdict_hash": verdict_hash,
             "validator_observations": {
                 "deductive": {
                     "observation_id": validation_record["witness_validations"]["deductive"]["observation_id"],
@@ -80,13 +110,16 @@ class FinalValidationLayer:
         }
         
         # Create content hash
-        content_str = json.dumps(envelope_content, sort_keys=True)
-        content_hash = hashlib.sha256(content_str.encode()).hexdigest()
+        content_bytes = _canonical(envelope_content)
+        content_digest = hashlib.sha256(content_bytes)
+        content_hash = content_digest.hexdigest()
         
         # Create deterministic "signature" (in production, this would be cryptographic)
-        # Using a combination of content hash + timestamp + system identifier
-        signature_seed = f"{content_hash}{validation_record['delivery_timestamp']}SF-ORB_VALIDATION_LAYER"
-        signature = hashlib.sha256(signature_seed.encode()).hexdigest()
+        # Continues the content hash state with timestamp + system identifier,
+        # i.e. sha256(content || timestamp || authority)
+        signature_digest = content_digest.copy()
+        signature_digest.update(f"{validation_record['delivery_timestamp']}SF-ORB_VALIDATION_LAYER".encode())
+        signature = signature_digest.hexdigest()
         
         # Create the signed envelope
         signed_envelope = {
@@ -97,7 +130,7 @@ class FinalValidationLayer:
             "signing_authority": "SF-ORB_Final_Validation_Layer",
             "signature_method": "SHA256_deterministic",
             "tamper_evidence": {
-                "content_length": len(content_str),
+                "content_length": len(content_bytes),
                 "validator_count": 3,
                 "consensus_congruent": envelope_content["consensus_analysis"]["congruent"]
             }
@@ -114,16 +147,20 @@ class FinalValidationLayer:
         package = {
             "verdict": core_verdict,
             "context": context,
-            "timestamp": time.time()
+            "timestamp": time.time(),
+            "hlsf_context": context.get("hlsf", {})  # Intuitive needs HLSF context
         }
         
-        # Run all three validations (parallel in production)
-        ded_val = self.deductive.validate_verdict(package)
-        ind_val = self.inductive.validate_verdict(package)
+        # Run all three validations in parallel
+        ded_future = self._pool.submit(self.deductive.validate_verdict, package)
+        ind_future = self._pool.submit(self.inductive.validate_verdict, package)
+        int_future = self._pool.submit(self.intuitive.validate_verdict, package)
+        ded_val = ded_future.result()
+        ind_val = ind_future.result()
+        int_val = int_future.result()
         
-        # Intuitive needs HLSF context
-        package["hlsf_context"] = context.get("hlsf", {})
-        int_val = self.intuitive.validate_verdict(package)
+        # Canonical verdict hash, computed once for the envelope
+        verdict_hash = hashlib.sha256(_canonical(core_verdict)).hexdigest()[:16]
         
         # Compile validation record
         validation_record = {
@@ -144,12 +181,14 @@ class FinalValidationLayer:
         }
         
         # Create signed witness envelope
-        signed_envelope = self.create_signed_witness_envelope(validation_record)
+        signed_envelope = self.create_signed_witness_envelope(validation_record, verdict_hash)
         validation_record["signed_witness_envelope"] = signed_envelope
         
         # Log complete record
-        with open("final_validation_log.jsonl", 'a') as f:
-            f.write(json.dumps(validation_record) + '\n')
+        self._log_fh.write(_dumpb(validation_record) + b'\n')
+        if validation_record["delivery_timestamp"] - self._last_log_flush >= LOG_FLUSH_INTERVAL:
+            self._log_fh.flush()
+            self._last_log_flush = validation_record["delivery_timestamp"]
         
         # Return original verdict + validation metadata
         # IMPORTANT: Original verdict is unchanged, just documented alongside
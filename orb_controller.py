@@ -227,7 +227,7 @@ class SF_ORB_Controller:
         logic_state = self._synthesize_logic_triad(inductive, intuition, bayes_shadows)
 
         neighbors = self.engine.get_recursive_neighbors(node, radius=3)
-        thought_vec = self.engine.calculate_thought_vector(neighbors + [node]) if neighbors else (0.0,) * self.engine.dimension
+        thought_vec = self.engine.calculate_thought_vector(neighbors + [node]) if neighbors else self.engine.zero_vector
 
         confidence = self._calculate_convergence(shadows, logic_state, thought_vec)
 
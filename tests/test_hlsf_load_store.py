@@ -0,0 +1,20 @@
+"""HLSF nodes and the engine's float32 load column must agree."""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hlsf_geometry.engine import HLSFEngine
+
+
+def test_node_load_matches_store():
+    engine = HLSFEngine()
+    for i in range(50):
+        stimulus = {"type": f"s{i % 7}", "intensity": 0.1 * (i % 9), "velocity": 0.37 * i}
+        engine.map_adjacency(stimulus)
+    engine.decay_vivacity(0.97)
+    engine.map_adjacency({"type": "s1", "intensity": 0.33, "velocity": 1.1})
+
+    for node_id, node in engine.field_map.items():
+        assert node.cognitive_load == float(engine._load[engine._rows[node_id]])
@@ -0,0 +1,56 @@
+"""Repaint gating of the floating orb after it leaves INTUITION-JUMP."""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtWidgets import QApplication
+
+from interface.orb_window import FloatingOrb, PulseView
+
+
+def _pulse(mode: str) -> PulseView:
+    return PulseView(
+        mode=mode,
+        glow=0.5,
+        field_density=0,
+        proc_time_ms=0.0,
+        edge_cutter_active=False,
+        predictive_target=None,
+        jump_vector=None,
+    )
+
+
+def test_orb_goes_idle_after_leaving_jump():
+    app = QApplication.instance() or QApplication([])
+    orb = FloatingOrb()
+    orb.anim_timer.stop()
+    orb.cognitive_timer.stop()
+    try:
+        # Leave JUMP mid-shockwave
+        orb.handle_pulse(_pulse("INTUITION-JUMP"))
+        for _ in range(3):
+            orb.update_animation()
+        assert orb.pulse_phase != 0
+
+        orb.handle_pulse(_pulse("GUARD"))
+        for _ in range(400):  # let color and position settle on GUARD
+            orb.update_animation()
+
+        repaints = []
+        orb.update = lambda: repaints.append(1)
+        orb._dirty_visual = False  # offscreen: no paintEvent clears it
+        for _ in range(20):
+            orb.update_animation()
+        assert repaints == []
+    finally:
+        orb.worker.running = False
+        orb.worker_thread.quit()
+        orb.worker_thread.wait()
+        orb.deleteLater()
+        app.processEvents()